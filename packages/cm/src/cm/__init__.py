@@ -1,10 +1,16 @@
 """cm - Company name matching system."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from cm.config import MatchConfig
-from cm.gemini import GeminiEmbeddingProvider, GeminiLLMProvider
-from cm.matcher import Matcher, MatcherStats
 from cm.types import MatchResult, NormalizedName
 
+if TYPE_CHECKING:
+    from cm.gemini import GeminiEmbeddingProvider, GeminiLLMProvider
+    from cm.matcher import Matcher, MatcherStats
+
 __all__ = [
     "GeminiEmbeddingProvider",
     "GeminiLLMProvider",
@@ -14,3 +20,23 @@ __all__ = [
     "MatchResult",
     "NormalizedName",
 ]
+
+# Heavy exports (google-genai, the numpy-based matcher) load on first use,
+# so importing a light cm submodule such as cm.cli does not pay for them
+_LAZY_EXPORTS = {
+    "GeminiEmbeddingProvider": "cm.gemini",
+    "GeminiLLMProvider": "cm.gemini",
+    "Matcher": "cm.matcher",
+    "MatcherStats": "cm.matcher",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'cm' has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import os
-import re
+from functools import lru_cache
 from pathlib import Path
 
 from cm.config import AcronymConfig
@@ -12,8 +12,11 @@ DATA_DIR = Path(os.environ.get("CM_CONFIG_DATA") or "config_data")
 
 
 def _load_collision_list() -> set[str]:
+    # Lowercased at load so lookups never need to fold case
     path = DATA_DIR / "acronym_collision.txt"
-    return {line.strip() for line in path.read_text().splitlines() if line.strip()}
+    return {
+        line.strip().lower() for line in path.read_text().splitlines() if line.strip()
+    }
 
 
 COLLISION_LIST: set[str] = _load_collision_list()
@@ -29,11 +32,20 @@ def generate_acronym(
     if config is None:
         config = AcronymConfig()
 
-    if len(core_tokens) < config.min_length:
+    return _generate_acronym(tuple(core_tokens), config.min_length)
+
+
+@lru_cache(maxsize=200_000)
+def _generate_acronym(core_tokens: tuple[str, ...], min_length: int) -> str | None:
+    """Memoized worker for generate_acronym (token tuples recur heavily)."""
+    if len(core_tokens) < min_length:
         return None
 
-    acronym = "".join(t[0] for t in core_tokens if t)
-    if len(acronym) < config.min_length:
+    # List comprehension: str.join materializes a list anyway, so this skips
+    # the generator frame. The `if t` guard stays because generate_acronym is
+    # public and callers outside normalize() may pass empty tokens.
+    acronym = "".join([t[0] for t in core_tokens if t])
+    if len(acronym) < min_length:
         return None
 
     return acronym
@@ -46,17 +58,29 @@ def normalize_acronym_input(text: str) -> str | None:
     otherwise None.
     """
     # Pattern: single letters separated by dots or spaces: I.B.M. or I B M
-    cleaned = re.sub(r"[.\s]+", "", text)
-    if len(cleaned) >= 3 and cleaned.isalpha() and all(
-        len(part) == 1 for part in re.split(r"[.\s]+", text) if part
-    ):
-        return cleaned.lower()
+    # Single pass that bails out on the first character breaking the shape.
+    letters: list[str] = []
+    prev_sep = True
+    for ch in text:
+        if ch == "." or ch.isspace():
+            prev_sep = True
+        elif ch.isalpha() and prev_sep:
+            letters.append(ch)
+            prev_sep = False
+        else:
+            return None
+    if len(letters) >= 3:
+        return "".join(letters).lower()
     return None
 
 
 def is_collision(acronym: str) -> bool:
-    """Check if an acronym is in the collision list."""
-    return acronym.lower() in COLLISION_LIST
+    """Check if an acronym is in the collision list.
+
+    Acronyms produced by normalize() are already lowercase, so no case
+    folding is done here.
+    """
+    return acronym in COLLISION_LIST
 
 
 def acronym_relation(
@@ -70,22 +94,22 @@ def acronym_relation(
     Returns one of: 'exact', 'initialism', 'collision', 'none'.
     """
     if a_acronym and b_acronym and a_acronym == b_acronym:
-        if is_collision(a_acronym):
+        if a_acronym in COLLISION_LIST:
             return "collision"
         return "exact"
 
     # Check if one side's acronym matches the other side's initialism
     if a_acronym and len(b_core_tokens) >= 3:
-        b_initialism = "".join(t[0] for t in b_core_tokens)
+        b_initialism = "".join([t[0] for t in b_core_tokens])
         if a_acronym == b_initialism:
-            if is_collision(a_acronym):
+            if a_acronym in COLLISION_LIST:
                 return "collision"
             return "initialism"
 
     if b_acronym and len(a_core_tokens) >= 3:
-        a_initialism = "".join(t[0] for t in a_core_tokens)
+        a_initialism = "".join([t[0] for t in a_core_tokens])
         if b_acronym == a_initialism:
-            if is_collision(b_acronym):
+            if b_acronym in COLLISION_LIST:
                 return "collision"
             return "initialism"
 
@@ -1,15 +1,32 @@
 """CLI tool for company name matching and duplicate detection."""
 
+from __future__ import annotations
+
 import argparse
+from collections import Counter
+from typing import TYPE_CHECKING
 
-import pandas as pd
 import structlog
 
 from cm.config import MatchConfig
+from cm.io import read_excel, write_excel
 from cm.logging import configure_logging
 from cm.manual_matches import ManualMatchStore
-from cm.matcher import Matcher
-from cm.normalize import normalize
+from cm.normalize import normalize, normalize_many
+
+# pandas, numpy and the matcher stack are imported inside the subcommands
+# that need them, so `cm --help` and argument errors return immediately
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from typing import BinaryIO
+
+    import pandas as pd
+
+    from cm.matcher import Matcher
+    from cm.types import MatchResult
+
+# Parsed input workbooks, reused while the source file is unchanged
+_EXCEL_CACHE_DIR = ".cm_cache/xlsx"
 
 
 def _build_config(args: argparse.Namespace) -> MatchConfig:
@@ -52,12 +69,15 @@ def _build_matcher(args: argparse.Namespace) -> Matcher:
         llm_provider = GeminiLLMProvider(client)
         config.embedding.enabled = True
         config.llm.enabled = True
+        config.llm.cache_path = ".cm_cache/llm_responses.jsonl"
         log.info(
             "gemini_providers_enabled",
             embedding_model=GeminiEmbeddingProvider.MODEL,
             llm_model=GeminiLLMProvider.MODEL,
         )
 
+    from cm.matcher import Matcher
+
     return Matcher(
         config=config,
         llm_provider=llm_provider,
@@ -68,23 +88,15 @@ def _build_matcher(args: argparse.Namespace) -> Matcher:
 def cmd_match(args: argparse.Namespace) -> None:
     log = structlog.get_logger()
     log.info("load_files_start", top=args.top, cup=args.cup)
-    top = pd.read_excel(args.top)
-    cup = pd.read_excel(args.cup)
+    top = read_excel(args.top, usecols=["A"], cache_dir=_EXCEL_CACHE_DIR)
+    cup = read_excel(args.cup, usecols=["CUP_NAME", "CUP_ID"], cache_dir=_EXCEL_CACHE_DIR)
 
     a_names = top["A"].dropna().tolist()
     b_names = cup["CUP_NAME"].dropna().tolist()
 
     log.info("files_loaded", a_count=len(a_names), b_count=len(b_names))
 
-    # Load manual matches if file exists
-    manual_match_map: dict[str, tuple[str, str | None]] = {}
-    if args.matches:
-        from pathlib import Path
-
-        store = ManualMatchStore(Path(args.matches))
-        store.load()
-        manual_match_map = store.get_a_to_b_map()
-        log.info("manual_matches_loaded", count=len(manual_match_map))
+    manual_match_map = _load_manual_matches(args.matches)
 
     matcher = _build_matcher(args)
     log.info("preprocess_b_start", b_count=len(b_names))
@@ -92,9 +104,152 @@ def cmd_match(args: argparse.Namespace) -> None:
     log.info("preprocess_b_done")
 
     if args.group:
-        _match_group(matcher, a_names, cup, args.output, args.show, manual_match_map)
+        _match_group(matcher, a_names, cup, args.output, args.show, manual_match_map, args.jobs)
     else:
-        _match_individual(matcher, a_names, cup, args.output, args.show, manual_match_map)
+        _match_individual(matcher, a_names, cup, args.output, args.show, manual_match_map, args.jobs)
+
+
+def _load_manual_matches(path: str | None) -> Mapping[str, tuple[str, str | None]]:
+    """Load the A -> (CUP name, CUP id) manual match map, if a file is given."""
+    if not path:
+        return {}
+    from pathlib import Path
+
+    store = ManualMatchStore(Path(path))
+    store.load()
+    manual_match_map = store.get_a_to_b_map()
+    structlog.get_logger().info("manual_matches_loaded", count=len(manual_match_map))
+    return manual_match_map
+
+
+def cmd_serve(args: argparse.Namespace) -> None:
+    """Keep a warm Matcher for the CUP file and run match jobs read from stdin.
+
+    Each input line is a JSON object with optional keys top, output,
+    matches, group, show and jobs (defaults come from the command line).
+    One JSON status line is written to stdout per job, so a driving script
+    can pipe jobs in and wait for each reply. B preprocessing, the CUP
+    workbook parse and the embedding cache load happen once.
+    """
+    import contextlib
+    import os
+    import sys
+
+    # Status lines go to a private copy of stdout; fd 1 itself is pointed at
+    # stderr (as is sys.stdout, which need not write through fd 1), so
+    # summaries and anything --jobs worker processes print cannot
+    # interleave with them
+    sys.stdout.flush()
+    status = os.fdopen(os.dup(1), "wb")
+    os.dup2(2, 1)
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            _serve_jobs(args, status)
+    finally:
+        sys.stdout.flush()
+        os.dup2(status.fileno(), 1)
+        status.close()
+
+
+def _serve_jobs(args: argparse.Namespace, status: BinaryIO) -> None:
+    """Run cmd_serve's job loop, writing one status line per job to status."""
+    import sys
+
+    from cm.io import dumps, loads
+
+    log = structlog.get_logger()
+    cup = read_excel(args.cup, usecols=["CUP_NAME", "CUP_ID"], cache_dir=_EXCEL_CACHE_DIR)
+    b_names = cup["CUP_NAME"].dropna().tolist()
+    matcher = _build_matcher(args)
+    log.info("preprocess_b_start", b_count=len(b_names))
+    matcher.preprocess_b(b_names)
+    log.info("serve_ready", b_count=len(b_names))
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            job = loads(line)
+            top_path = job.get("top", args.top)
+            output = job.get("output", args.output)
+            top = read_excel(top_path, usecols=["A"], cache_dir=_EXCEL_CACHE_DIR)
+            a_names = top["A"].dropna().tolist()
+            manual_match_map = _load_manual_matches(job.get("matches", args.matches))
+            run = _match_group if job.get("group", False) else _match_individual
+            # Each job reports its own stats and gets the full LLM call cap
+            matcher.reset_stats()
+            run(
+                matcher,
+                a_names,
+                cup,
+                output,
+                job.get("show", False),
+                manual_match_map,
+                job.get("jobs", args.jobs),
+            )
+            reply = {"ok": True, "output": output, "a_count": len(a_names)}
+        except Exception as exc:  # keep serving after a bad job
+            log.error("serve_job_failed", error=str(exc))
+            reply = {"ok": False, "error": str(exc)}
+        status.write(dumps(reply) + b"\n")
+        status.flush()
+
+
+def _cup_ids(cup: pd.DataFrame):
+    """CUP_ID values aligned with the B list (b_id indexes non-null CUP_NAMEs)."""
+    return cup.loc[cup["CUP_NAME"].notna(), "CUP_ID"].to_numpy()
+
+
+def _results_frame(
+    manual: list[tuple[str, str, str | None]],
+    results: list[MatchResult],
+    cup: pd.DataFrame,
+    group_sizes: Counter[str] | None = None,
+) -> pd.DataFrame:
+    """Build the output frame column-wise: manual matches first, then matcher results.
+
+    manual holds (A name, CUP name, CUP id) triples. group_sizes adds a
+    group_size column (group mode).
+    """
+    import numpy as np
+    import pandas as pd
+
+    cup_ids = _cup_ids(cup)
+    n_manual = len(manual)
+
+    columns: dict[str, object] = {"A_name": [a for a, _, _ in manual] + [r.a_name for r in results]}
+    if group_sizes is not None:
+        columns["group_size"] = [group_sizes[a] for a in columns["A_name"]]
+    columns["matched_CUP_NAME"] = [b for _, b, _ in manual] + [r.b_name for r in results]
+    columns["matched_CUP_ID"] = [b_id for _, _, b_id in manual] + [
+        cup_ids[r.b_id] if r.b_id is not None else None for r in results
+    ]
+    # A handful of distinct values repeat on every row: store decisions as a
+    # categorical and share one string per distinct reasons combination
+    columns["decision"] = pd.Categorical(
+        ["MANUAL_MATCH"] * n_manual + [r.decision for r in results]
+    )
+    columns["score"] = np.round(
+        np.array([1.0] * n_manual + [r.score for r in results], dtype=float), 4
+    )
+    columns["runner_up_score"] = np.round(
+        np.array(
+            [np.nan] * n_manual
+            + [np.nan if r.runner_up_score is None else r.runner_up_score for r in results],
+            dtype=float,
+        ),
+        4,
+    )
+    joined_reasons: dict[tuple[str, ...], str] = {}
+    reasons = ["manual_match"] * n_manual
+    for r in results:
+        key = tuple(r.reasons)
+        joined = joined_reasons.get(key)
+        if joined is None:
+            joined = joined_reasons[key] = "; ".join(key)
+        reasons.append(joined)
+    columns["reasons"] = reasons
+    return pd.DataFrame(columns)
 
 
 def _match_individual(
@@ -103,52 +258,37 @@ def _match_individual(
     cup: pd.DataFrame,
     output: str,
     show: bool,
-    manual_match_map: dict[str, tuple[str, str | None]] | None = None,
+    manual_match_map: Mapping[str, tuple[str, str | None]] | None = None,
+    jobs: int = 1,
 ) -> None:
     manual_match_map = manual_match_map or {}
 
     # Separate A names into manual matches and those needing matching
-    manual_results: list[dict] = []
+    manual_results: list[tuple[str, str, str | None]] = []
     names_to_match: list[str] = []
 
     for name in a_names:
         if name in manual_match_map:
             b_name, b_id = manual_match_map[name]
-            manual_results.append({
-                "A_name": name,
-                "matched_CUP_NAME": b_name,
-                "matched_CUP_ID": b_id,
-                "decision": "MANUAL_MATCH",
-                "score": 1.0,
-                "runner_up_score": None,
-                "reasons": "manual_match",
-            })
+            manual_results.append((name, b_name, b_id))
         else:
             names_to_match.append(name)
 
-    # Run matcher on remaining names
-    results = matcher.match_all(names_to_match) if names_to_match else []
+    # Run matcher once per distinct remaining name, then fan results back
+    # out so every input row still gets its own output row
+    unique_to_match = list(dict.fromkeys(names_to_match))
+    unique_results = matcher.match_all(unique_to_match, workers=jobs) if unique_to_match else []
+    result_by_name = dict(zip(unique_to_match, unique_results))
 
-    rows = list(manual_results)  # Start with manual matches
-    for r in results:
-        rows.append({
-            "A_name": r.a_name,
-            "matched_CUP_NAME": r.b_name,
-            "matched_CUP_ID": cup.iloc[r.b_id]["CUP_ID"] if r.b_id is not None else None,
-            "decision": r.decision,
-            "score": round(r.score, 4),
-            "runner_up_score": round(r.runner_up_score, 4) if r.runner_up_score is not None else None,
-            "reasons": "; ".join(r.reasons),
-        })
-
-    df_out = pd.DataFrame(rows)
+    results = [result_by_name[name] for name in names_to_match]
+    df_out = _results_frame(manual_results, results, cup)
 
     if show:
         _show_matches(df_out)
 
     _print_summary(df_out, manual_count=len(manual_results))
     _print_stats(matcher)
-    df_out.to_excel(output, index=False)
+    write_excel(df_out, output)
     print(f"\nSaved to: {output}")
 
 
@@ -158,63 +298,40 @@ def _match_group(
     cup: pd.DataFrame,
     output: str,
     show: bool,
-    manual_match_map: dict[str, tuple[str, str | None]] | None = None,
+    manual_match_map: Mapping[str, tuple[str, str | None]] | None = None,
+    jobs: int = 1,
 ) -> None:
     manual_match_map = manual_match_map or {}
 
     # Group A names by exact value
-    groups: dict[str, int] = {}
-    for name in a_names:
-        groups[name] = groups.get(name, 0) + 1
+    groups = Counter(a_names)
 
     unique_names = list(groups.keys())
     print(f"Unique A groups: {len(unique_names)} (from {len(a_names)} rows)")
 
     # Separate unique names into manual matches and those needing matching
-    manual_results: list[dict] = []
+    manual_results: list[tuple[str, str, str | None]] = []
     names_to_match: list[str] = []
 
     for name in unique_names:
         if name in manual_match_map:
             b_name, b_id = manual_match_map[name]
-            manual_results.append({
-                "A_name": name,
-                "group_size": groups[name],
-                "matched_CUP_NAME": b_name,
-                "matched_CUP_ID": b_id,
-                "decision": "MANUAL_MATCH",
-                "score": 1.0,
-                "runner_up_score": None,
-                "reasons": "manual_match",
-            })
+            manual_results.append((name, b_name, b_id))
         else:
             names_to_match.append(name)
 
     # Match each unique name (all members of a group share the same value,
     # so matching once per unique name suffices for exact-duplicate groups)
-    results = matcher.match_all(names_to_match) if names_to_match else []
+    results = matcher.match_all(names_to_match, workers=jobs) if names_to_match else []
 
-    rows = list(manual_results)  # Start with manual matches
-    for r in results:
-        rows.append({
-            "A_name": r.a_name,
-            "group_size": groups[r.a_name],
-            "matched_CUP_NAME": r.b_name,
-            "matched_CUP_ID": cup.iloc[r.b_id]["CUP_ID"] if r.b_id is not None else None,
-            "decision": r.decision,
-            "score": round(r.score, 4),
-            "runner_up_score": round(r.runner_up_score, 4) if r.runner_up_score is not None else None,
-            "reasons": "; ".join(r.reasons),
-        })
-
-    df_out = pd.DataFrame(rows)
+    df_out = _results_frame(manual_results, results, cup, group_sizes=groups)
 
     if show:
         _show_matches(df_out)
 
     _print_summary(df_out, manual_count=len(manual_results))
     _print_stats(matcher)
-    df_out.to_excel(output, index=False)
+    write_excel(df_out, output)
     print(f"\nSaved to: {output}")
 
 
@@ -251,66 +368,64 @@ def _print_stats(matcher: Matcher) -> None:
 
 
 def _print_summary(df: pd.DataFrame, manual_count: int = 0) -> None:
-    # If group_size column exists, compute row-weighted counts
-    if "group_size" in df.columns:
-        manual_rows = df.loc[df["decision"] == "MANUAL_MATCH", "group_size"].sum()
-        match_rows = df.loc[df["decision"] == "MATCH", "group_size"].sum()
-        no_match_rows = df.loc[df["decision"] == "NO_MATCH", "group_size"].sum()
-        review_rows = df.loc[df["decision"] == "REVIEW", "group_size"].sum()
-        parts = [f"MATCH={match_rows}", f"NO_MATCH={no_match_rows}", f"REVIEW={review_rows}"]
-        if manual_rows > 0:
-            parts.insert(0, f"MANUAL_MATCH={manual_rows}")
-        print(f"\nResults (rows): {', '.join(parts)}")
+    # One aggregation pass over the decision column; with group_size, counts
+    # are row-weighted
+    grouped = "group_size" in df.columns
+    if grouped:
+        counts = df.groupby("decision")["group_size"].sum()
     else:
-        manual_count_actual = (df["decision"] == "MANUAL_MATCH").sum()
-        match_count = (df["decision"] == "MATCH").sum()
-        no_match_count = (df["decision"] == "NO_MATCH").sum()
-        review_count = (df["decision"] == "REVIEW").sum()
-        parts = [f"MATCH={match_count}", f"NO_MATCH={no_match_count}", f"REVIEW={review_count}"]
-        if manual_count_actual > 0:
-            parts.insert(0, f"MANUAL_MATCH={manual_count_actual}")
-        print(f"\nResults: {', '.join(parts)}")
+        counts = df["decision"].value_counts()
+
+    parts = [f"{decision}={int(counts.get(decision, 0))}" for decision in ("MATCH", "NO_MATCH", "REVIEW")]
+    manual = int(counts.get("MANUAL_MATCH", 0))
+    if manual > 0:
+        parts.insert(0, f"MANUAL_MATCH={manual}")
+    label = "Results (rows)" if grouped else "Results"
+    print(f"\n{label}: {', '.join(parts)}")
 
 
 def cmd_dupes(args: argparse.Namespace) -> None:
     config = _build_config(args)
     use_normalization = bool(config.normalization.strip_categories)
 
-    top = pd.read_excel(args.top)
-    cup = pd.read_excel(args.cup)
+    top = read_excel(args.top, usecols=["A"], cache_dir=_EXCEL_CACHE_DIR)
+    cup = read_excel(args.cup, usecols=["CUP_NAME"], cache_dir=_EXCEL_CACHE_DIR)
 
     # Duplicates in top_2000_unmapped column A
     a_col = top["A"].dropna()
 
     if use_normalization:
         # Group by normalized core_string
-        a_normalized = {name: normalize(name, config).core_string for name in a_col}
+        # Normalize each distinct name once; group sizes accumulate in the same pass
+        a_counts = Counter(a_col)
         a_groups: dict[str, list[str]] = {}
-        for orig, norm in a_normalized.items():
-            a_groups.setdefault(norm, []).append(orig)
+        a_group_counts: Counter[str] = Counter()
+        for orig, n in zip(a_counts, normalize_many(list(a_counts), config)):
+            a_groups.setdefault(n.core_string, []).append(orig)
+            a_group_counts[n.core_string] += a_counts[orig]
 
         print("=== Duplicates in top_2000_unmapped (column A) [normalized] ===")
         has_dupes = False
         for norm, originals in sorted(a_groups.items()):
-            count = sum(1 for name in a_col if a_normalized.get(name) == norm)
+            count = a_group_counts[norm]
             if count > 1:
                 has_dupes = True
-                unique_originals = sorted(set(originals))
                 print(f"  {norm} (x{count})")
-                for orig in unique_originals:
-                    orig_count = list(a_col).count(orig)
-                    print(f"    - {orig} (x{orig_count})")
+                for orig in sorted(originals):
+                    print(f"    - {orig} (x{a_counts[orig]})")
         if not has_dupes:
             print("  No duplicates found.")
     else:
-        a_dupes = a_col[a_col.duplicated(keep=False)].sort_values()
+        # One hash pass: the counts give both the listing and the totals
+        a_vc = a_col.value_counts()
+        a_dupes = a_vc[a_vc > 1].sort_index()
         print("=== Duplicates in top_2000_unmapped (column A) ===")
         if a_dupes.empty:
             print("  No duplicates found.")
         else:
-            for name, count in a_col.value_counts()[a_col.value_counts() > 1].sort_index().items():
+            for name, count in a_dupes.items():
                 print(f"  {name} (x{count})")
-            print(f"\n  Total: {a_dupes.nunique()} duplicate names, {len(a_dupes)} total rows")
+            print(f"\n  Total: {len(a_dupes)} duplicate names, {int(a_dupes.sum())} total rows")
 
     print()
 
@@ -318,38 +433,61 @@ def cmd_dupes(args: argparse.Namespace) -> None:
     b_col = cup["CUP_NAME"].dropna()
 
     if use_normalization:
-        b_normalized = {name: normalize(name, config).core_string for name in b_col}
+        # Normalize each distinct name once; group sizes accumulate in the same pass
+        b_counts = Counter(b_col)
         b_groups: dict[str, list[str]] = {}
-        for orig, norm in b_normalized.items():
-            b_groups.setdefault(norm, []).append(orig)
+        b_group_counts: Counter[str] = Counter()
+        for orig, n in zip(b_counts, normalize_many(list(b_counts), config)):
+            b_groups.setdefault(n.core_string, []).append(orig)
+            b_group_counts[n.core_string] += b_counts[orig]
 
         print("=== Duplicates in CUP_raw_data (CUP_NAME) [normalized] ===")
         has_dupes = False
         for norm, originals in sorted(b_groups.items()):
-            count = sum(1 for name in b_col if b_normalized.get(name) == norm)
+            count = b_group_counts[norm]
             if count > 1:
                 has_dupes = True
-                unique_originals = sorted(set(originals))
                 print(f"  {norm} (x{count})")
-                for orig in unique_originals:
-                    orig_count = list(b_col).count(orig)
-                    print(f"    - {orig} (x{orig_count})")
+                for orig in sorted(originals):
+                    print(f"    - {orig} (x{b_counts[orig]})")
         if not has_dupes:
             print("  No duplicates found.")
     else:
-        b_dupes = b_col[b_col.duplicated(keep=False)].sort_values()
+        # One hash pass: the counts give both the listing and the totals
+        b_vc = b_col.value_counts()
+        b_dupes = b_vc[b_vc > 1].sort_index()
         print("=== Duplicates in CUP_raw_data (CUP_NAME) ===")
         if b_dupes.empty:
             print("  No duplicates found.")
         else:
-            for name, count in b_col.value_counts()[b_col.value_counts() > 1].sort_index().items():
+            for name, count in b_dupes.items():
                 print(f"  {name} (x{count})")
-            print(f"\n  Total: {b_dupes.nunique()} duplicate names, {len(b_dupes)} total rows")
+            print(f"\n  Total: {len(b_dupes)} duplicate names, {int(b_dupes.sum())} total rows")
+
+
+def _open_browser_when_listening(url: str, port: int, timeout: float = 30.0) -> None:
+    """Open url once something accepts connections on port (runs in a thread).
+
+    uvicorn runs lifespan/startup hooks before it binds its socket, so a
+    startup hook would still race the browser; polling the port does not.
+    """
+    import socket
+    import time
+    import webbrowser
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                break
+        except OSError:
+            time.sleep(0.1)
+    webbrowser.open(url)
 
 
 def cmd_verify(args: argparse.Namespace) -> None:
     """Launch the verify UI for manual matching."""
-    import webbrowser
+    import threading
 
     import uvicorn
 
@@ -370,11 +508,14 @@ def cmd_verify(args: argparse.Namespace) -> None:
         cup_path=args.cup,
         matches_path=args.matches,
         results_path=args.results,
+        excel_cache_dir=_EXCEL_CACHE_DIR,
     )
 
     url = f"http://localhost:{args.port}"
     print(f"Starting verify UI at {url}")
-    webbrowser.open(url)
+    threading.Thread(
+        target=_open_browser_when_listening, args=(url, args.port), daemon=True
+    ).start()
     uvicorn.run(app, host="0.0.0.0", port=args.port, log_level="warning")
 
 
@@ -391,37 +532,19 @@ def cmd_finalize(args: argparse.Namespace) -> None:
     )
 
     # Load automatic matching results
-    results_df = pd.read_excel(args.results)
+    results_df = read_excel(args.results)
     log.info("results_loaded", count=len(results_df))
 
     # Load manual matches
     store = ManualMatchStore(Path(args.matches))
     store.load()
-    manual_matches = store.get_all()
-    log.info("manual_matches_loaded", count=len(manual_matches))
-
-    # Build a mapping from A name to manual match info
-    a_to_manual: dict[str, tuple[str, str | None]] = {}
-    for match in manual_matches:
-        for a_name in match.a_names:
-            a_to_manual[a_name] = (match.b_name, match.b_id)
+    log.info("manual_matches_loaded", count=len(store.get_all()))
 
     # Apply manual matches to results
-    updated_count = 0
-    for idx, row in results_df.iterrows():
-        a_name = row["A_name"]
-        if a_name in a_to_manual:
-            b_name, b_id = a_to_manual[a_name]
-            results_df.at[idx, "matched_CUP_NAME"] = b_name
-            results_df.at[idx, "matched_CUP_ID"] = b_id
-            results_df.at[idx, "decision"] = "MANUAL_MATCH"
-            results_df.at[idx, "score"] = 1.0
-            results_df.at[idx, "runner_up_score"] = None
-            results_df.at[idx, "reasons"] = "manual_match"
-            updated_count += 1
+    updated_count = store.apply_to_results(results_df)
 
     # Save finalized results
-    results_df.to_excel(args.output, index=False)
+    write_excel(results_df, args.output)
     log.info(
         "finalize_complete",
         output=args.output,
@@ -435,11 +558,15 @@ def cmd_finalize(args: argparse.Namespace) -> None:
 
 def cmd_clean(args: argparse.Namespace) -> None:
     """Generate cleaned versions of names with different normalization levels."""
-    from cm.config import MatchConfig
+    from dataclasses import replace
+
+    import numpy as np
+    import pandas as pd
+
     from cm.designators import get_available_categories
 
-    top = pd.read_excel(args.top)
-    cup = pd.read_excel(args.cup)
+    top = read_excel(args.top, usecols=["A"], cache_dir=_EXCEL_CACHE_DIR)
+    cup = read_excel(args.cup, usecols=["CUP_NAME"], cache_dir=_EXCEL_CACHE_DIR)
 
     # Get available categories (exclude stopwords since it's now default)
     all_categories = get_available_categories()
@@ -448,38 +575,44 @@ def cmd_clean(args: argparse.Namespace) -> None:
     # Build configs: base (includes stopwords), one per extra category, and all combined
     config_base = MatchConfig()  # Already includes stopwords by default
 
-    category_configs: dict[str, MatchConfig] = {}
-    for cat in extra_categories:
-        cfg = MatchConfig()  # Starts with stopwords
-        cfg.normalization.strip_categories.append(cat)  # Add this category
-        category_configs[cat] = cfg
+    def with_categories(categories: list[str]) -> MatchConfig:
+        # Variants differ only in strip_categories; every other sub-config is shared
+        normalization = replace(config_base.normalization, strip_categories=categories)
+        return replace(config_base, normalization=normalization)
 
-    config_all = MatchConfig()
-    config_all.normalization.strip_categories = list(all_categories)
+    base_categories = config_base.normalization.strip_categories
+    category_configs: dict[str, MatchConfig] = {
+        cat: with_categories([*base_categories, cat]) for cat in extra_categories
+    }
+    config_all = with_categories(list(all_categories))
 
     def clean_names(names: list[str]) -> pd.DataFrame:
-        rows = []
-        for name in names:
-            row = {
-                "original": name,
-                "normalized": normalize(name, config_base).core_string,
-            }
-            # Add column for each extra category (stopwords already in normalized)
-            for cat in extra_categories:
-                row[f"no_{cat}"] = normalize(name, category_configs[cat]).core_string
-            # Add combined column
-            if len(extra_categories) > 0:
-                row["no_all"] = normalize(name, config_all).core_string
-            rows.append(row)
-        return pd.DataFrame(rows)
+        # Factorize once, normalize each distinct name per config, then
+        # expand back to row order with one take per column
+        codes, uniques = pd.factorize(pd.Series(names, dtype=object))
+
+        def core_strings(config: MatchConfig) -> np.ndarray:
+            distinct = [normalize(name, config).core_string for name in uniques]
+            return np.array(distinct, dtype=object)[codes]
+
+        columns: dict[str, list[str] | np.ndarray] = {
+            "original": names,
+            "normalized": core_strings(config_base),
+        }
+        # Add column for each extra category (stopwords already in normalized)
+        for cat in extra_categories:
+            columns[f"no_{cat}"] = core_strings(category_configs[cat])
+        # Add combined column
+        if len(extra_categories) > 0:
+            columns["no_all"] = core_strings(config_all)
+        return pd.DataFrame(columns)
 
     def filter_df(df: pd.DataFrame, search: str) -> pd.DataFrame:
         """Filter dataframe rows where any column contains search string (case-insensitive)."""
-        search_lower = search.lower()
-        mask = df.apply(
-            lambda row: any(search_lower in str(val).lower() for val in row),
-            axis=1,
-        )
+        mask = pd.Series(False, index=df.index)
+        for col in df.columns:
+            # case=False avoids materializing a lowercased copy of each column
+            mask |= df[col].astype(str).str.contains(search, case=False, regex=False, na=False)
         return df[mask]
 
     # Process top file (column A)
@@ -510,10 +643,10 @@ def cmd_clean(args: argparse.Namespace) -> None:
             print("  No matches found.")
     else:
         # Write to files
-        df_a.to_excel(args.output_top, index=False)
+        write_excel(df_a, args.output_top)
         print(f"Cleaned {len(a_names)} A names -> {args.output_top}")
 
-        df_b.to_excel(args.output_cup, index=False)
+        write_excel(df_b, args.output_cup)
         print(f"Cleaned {len(b_names)} B names -> {args.output_cup}")
 
 
@@ -553,8 +686,18 @@ def main() -> None:
     match_parser.add_argument("--cup", default="localdata/CUP_raw_data.xlsx", help="Path to CUP raw data file")
     match_parser.add_argument("--matches", default="manual_matches.json", help="Path to manual matches file")
     match_parser.add_argument("--output", default="localdata/matching_results.xlsx", help="Output file path")
+    match_parser.add_argument("--jobs", type=int, default=1, help="Worker processes for scoring (default: 1); LLM arbitration still runs in the main process")
     match_parser.set_defaults(func=cmd_match)
 
+    # serve subcommand
+    serve_parser = subparsers.add_parser("serve", parents=[parent_parser], help="Run match jobs from stdin against a warm CUP index")
+    serve_parser.add_argument("--top", default="localdata/top_2000_unmapped.xlsx", help="Default top file for jobs")
+    serve_parser.add_argument("--cup", default="localdata/CUP_raw_data.xlsx", help="Path to CUP raw data file")
+    serve_parser.add_argument("--matches", default="manual_matches.json", help="Default manual matches file for jobs")
+    serve_parser.add_argument("--output", default="localdata/matching_results.xlsx", help="Default output file for jobs")
+    serve_parser.add_argument("--jobs", type=int, default=1, help="Default worker processes per job")
+    serve_parser.set_defaults(func=cmd_serve)
+
     # dupes subcommand
     dupes_parser = subparsers.add_parser("dupes", parents=[parent_parser], help="Find duplicate names")
     dupes_parser.add_argument("--top", default="localdata/top_2000_unmapped.xlsx", help="Path to top 2000 file")
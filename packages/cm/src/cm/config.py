@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Literal, get_args
+
+Quantization = Literal["none", "binary"]
 
 
 @dataclass
@@ -42,6 +45,8 @@ class LLMConfig:
     per_item_call_cap: int = 2
     min_confidence: float = 0.75
     forbid_both_single_token: bool = True
+    cache_path: str | None = None  # JSONL of LLM answers reused across runs
+    max_concurrency: int = 8  # Arbitration requests kept in flight at once
 
 
 @dataclass
@@ -50,6 +55,20 @@ class EmbeddingConfig:
     ann_neighbors: int = 100
     cache_dir: str = ".cm_cache/embeddings"
     batch_size: int = 250  # Vertex AI limit: 250 texts per request
+    max_concurrency: int = 8  # Embedding requests kept in flight at once
+    hnsw_min_size: int = 10_000  # Below this, brute-force scan beats HNSW
+    hnsw_m: int = 16
+    hnsw_ef_construction: int = 200
+    jit_min_size: int = 100_000  # Below this, BLAS matmul beats the Numba kernel
+    quantization: Quantization = "none"  # "binary": Hamming prefilter + exact rerank
+    binary_oversample: int = 4  # Shortlist size = ann_neighbors * oversample
+
+    def __post_init__(self) -> None:
+        if self.quantization not in get_args(Quantization):
+            raise ValueError(
+                f"Unknown quantization {self.quantization!r}; "
+                f"expected one of {get_args(Quantization)}"
+            )
 
 
 @dataclass
@@ -77,3 +96,5 @@ class MatchConfig:
     embedding: EmbeddingConfig = field(default_factory=EmbeddingConfig)
     acronym: AcronymConfig = field(default_factory=AcronymConfig)
     normalization: NormalizationConfig = field(default_factory=NormalizationConfig)
+    # Attach top candidates and warnings to every result, not only REVIEW ones
+    debug_always: bool = False
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import os
+import sys
 from pathlib import Path
 
 DATA_DIR = Path(os.environ.get("CM_CONFIG_DATA") or "config_data")
@@ -27,16 +28,26 @@ def _load_aliases() -> dict[str, str]:
 
 
 # Cache for dynamically loaded word lists
-_CATEGORY_CACHE: dict[str, set[str]] = {}
+_CATEGORY_CACHE: dict[str, frozenset[str]] = {}
+# Union of word lists per category combination (strip_word_categories runs per name)
+_UNION_CACHE: dict[tuple[str, ...], frozenset[str]] = {}
 
 
-def load_category_words(category: str) -> set[str]:
+def load_category_words(category: str) -> frozenset[str]:
     """Load word list for a category (e.g., 'location' loads 'location.txt')."""
     if category not in _CATEGORY_CACHE:
-        _CATEGORY_CACHE[category] = _load_word_list(f"{category}.txt")
+        _CATEGORY_CACHE[category] = frozenset(_load_word_list(f"{category}.txt"))
     return _CATEGORY_CACHE[category]
 
 
+def _category_union(categories: list[str]) -> frozenset[str]:
+    key = tuple(categories)
+    words = _UNION_CACHE.get(key)
+    if words is None:
+        words = _UNION_CACHE[key] = frozenset().union(*map(load_category_words, categories))
+    return words
+
+
 def get_available_categories() -> list[str]:
     """Return list of available category names (files matching *.txt except designators)."""
     exclude = {"designators_global.txt", "designator_aliases.json"}
@@ -47,7 +58,32 @@ def get_available_categories() -> list[str]:
     return sorted(categories)
 
 
-DESIGNATORS: set[str] = _load_word_list("designators_global.txt")
+_TRIE_END = ""  # Marks a complete designator phrase (tokens are never empty)
+
+
+def _build_trie(phrases: set[str], *, reverse: bool) -> dict:
+    """Build a token trie over designator phrases (reversed for suffix matching)."""
+    root: dict = {}
+    for phrase in phrases:
+        tokens = phrase.split()
+        if reverse:
+            tokens.reverse()
+        node = root
+        for token in tokens:
+            node = node.setdefault(sys.intern(token), {})
+        node[_TRIE_END] = True
+    return root
+
+
+_DESIGNATOR_PHRASES: set[str] = _load_word_list("designators_global.txt")
+
+# Interned so membership tests against interned tokens short-circuit on identity
+DESIGNATORS: frozenset[str] = frozenset(
+    sys.intern(p) for p in _DESIGNATOR_PHRASES if " " not in p
+)
+# Multi-token designators (e.g. "private limited") are only matched via the tries
+SUFFIX_TRIE: dict = _build_trie(_DESIGNATOR_PHRASES, reverse=True)
+PREFIX_TRIE: dict = _build_trie(_DESIGNATOR_PHRASES, reverse=False)
 ALIASES: dict[str, str] = _load_aliases()
 
 
@@ -74,7 +110,7 @@ def strip_word_categories(
     """Strip words from specified categories from token list.
 
     Args:
-        tokens: List of tokens to process.
+        tokens: List of casefolded tokens to process (as produced by normalize()).
         categories: List of category names (e.g., ["location", "institution"]).
 
     Returns:
@@ -84,16 +120,15 @@ def strip_word_categories(
     if not categories:
         return list(tokens), []
 
-    # Load all category word sets
-    category_words: set[str] = set()
-    for category in categories:
-        category_words.update(load_category_words(category))
+    category_words = _category_union(categories)
 
+    # Word lists are lowercased at load and tokens are already casefolded,
+    # so each token is a single hash lookup
     removed: list[str] = []
     filtered: list[str] = []
 
     for token in tokens:
-        if token.lower() in category_words:
+        if token in category_words:
             removed.append(token)
         else:
             filtered.append(token)
@@ -105,6 +140,19 @@ def strip_word_categories(
     return filtered, removed
 
 
+def _longest_designator(tokens: list[str], positions: range, trie: dict) -> int:
+    """Length of the longest designator phrase read from tokens at positions."""
+    node = trie
+    longest = 0
+    for n, i in enumerate(positions, 1):
+        node = node.get(tokens[i])
+        if node is None:
+            break
+        if _TRIE_END in node:
+            longest = n
+    return longest
+
+
 def strip_designators(
     tokens: list[str],
     *,
@@ -128,22 +176,22 @@ def strip_designators(
     removed: list[str] = []
     core: list[str] = []
 
-    # Find suffix designators (from the end)
+    # Find suffix designators (from the end), longest phrase first
     suffix_start = len(tokens)
-    for i in range(len(tokens) - 1, -1, -1):
-        if is_designator(tokens[i]):
-            suffix_start = i
-        else:
+    while suffix_start > 0:
+        n = _longest_designator(tokens, range(suffix_start - 1, -1, -1), SUFFIX_TRIE)
+        if not n:
             break
+        suffix_start -= n
 
     # Find prefix designators (from the start)
     prefix_end = 0
     if strip_prefix:
-        for i in range(len(tokens)):
-            if is_designator(tokens[i]):
-                prefix_end = i + 1
-            else:
+        while prefix_end < len(tokens):
+            n = _longest_designator(tokens, range(prefix_end, len(tokens)), PREFIX_TRIE)
+            if not n:
                 break
+            prefix_end += n
 
     # Build core tokens, collecting removed
     for i, token in enumerate(tokens):
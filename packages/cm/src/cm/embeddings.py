@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-import json
+import importlib.util
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Protocol
 
@@ -10,9 +12,31 @@ import numpy as np
 import structlog
 
 from cm.config import EmbeddingConfig
+from cm.io import dumps, loads
+
+try:
+    import hnswlib
+except ImportError:  # optional: fall back to brute-force cosine scan
+    hnswlib = None
+
+# numba takes ~170 ms to import, so only check it is installed here; the
+# kernel module imports it the first time a large catalog is scanned
+# (optional: fall back to BLAS matmul + argpartition)
+_HAS_NUMBA = importlib.util.find_spec("numba") is not None
 
 log = structlog.get_logger()
 
+# Bits set per byte value, for Hamming distance on NumPy < 2.0
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _hamming(packed: np.ndarray, query_packed: np.ndarray) -> np.ndarray:
+    """Row-wise Hamming distance between bit-packed matrix rows and a query."""
+    xor = np.bitwise_xor(packed, query_packed)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(xor).sum(axis=1, dtype=np.int32)
+    return _POPCOUNT[xor].sum(axis=1, dtype=np.int32)
+
 
 class EmbeddingProvider(Protocol):
     """Protocol for embedding providers (e.g. Gemini)."""
@@ -20,6 +44,25 @@ class EmbeddingProvider(Protocol):
     def embed_batch(self, texts: list[str]) -> list[list[float]]: ...
 
 
+class _CacheOnlyProvider:
+    """Stand-in provider for worker copies of an EmbeddingIndex."""
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        raise RuntimeError(
+            "embedding provider is not available in worker processes; "
+            "precompute embeddings before matching"
+        )
+
+
+def _topk_cosine(
+    embeddings: np.ndarray, query: np.ndarray, k: int, n_chunks: int | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Numba top-k cosine scan (see cm.kernels); imports numba on first use."""
+    from cm.kernels import topk_cosine
+
+    return topk_cosine(embeddings, query, k, n_chunks)
+
+
 class EmbeddingIndex:
     """Embedding-based ANN index for candidate generation."""
 
@@ -29,29 +72,101 @@ class EmbeddingIndex:
         self.config = config
         self.provider = provider
         self._embeddings: np.ndarray | None = None
-        self._cache: dict[str, list[float]] = {}
+        self._hnsw = None
+        self._packed: np.ndarray | None = None
+        # B names sharing a core_string share one row of _embeddings. When any
+        # do, _b_row maps b_id -> row and _row_members[_row_start[r]:_row_start[r + 1]]
+        # lists the b_ids of row r; both stay None for an all-distinct catalog.
+        self._n_b: int = 0
+        self._b_row: np.ndarray | None = None
+        self._row_members: np.ndarray | None = None
+        self._row_start: np.ndarray | None = None
+        # Cache maps core_string -> row in _cache_matrix (float32, N x D)
+        self._cache: dict[str, int] = {}
+        self._cache_matrix: np.ndarray | None = None
+        self._cache_rows: int = 0
+        self._saved_rows: int = 0  # Rows already persisted (saves append the rest)
+        self._dirty: list[str] = []  # Keys added since the last save, in row order
+        self._cache_loaded: bool = False
+        # Unit-length vectors for cosine_similarity, keyed by core_string
+        self._norm_cache: dict[str, np.ndarray] = {}
         self._cache_dir = Path(config.cache_dir)
         # Stats tracking
         self.api_calls: int = 0
         self.cache_hits: int = 0
 
+    def __getstate__(self) -> dict:
+        # Providers wrap network clients that cannot be pickled; a copy sent
+        # to a worker process serves from the (precomputed) cache only
+        state = self.__dict__.copy()
+        if self.provider is not None:
+            state["provider"] = _CacheOnlyProvider()
+        return state
+
     def build(self, core_strings: list[str]) -> None:
         """Compute and store embeddings for all B core_strings."""
         if self.provider is None:
             log.warning("no_embedding_provider", reason="skipping build")
             return
 
-        self._load_cache()
-        log.info("embedding_cache_loaded", cached_count=len(self._cache))
+        # Repeated builds (e.g. per-pair evaluation) reuse the in-memory cache
+        if not self._cache_loaded:
+            self._load_cache()
+            self._cache_loaded = True
+            log.info("embedding_cache_loaded", cached_count=len(self._cache))
+
+        rows = self._batch_embed(core_strings, label="B")
+
+        # Index each distinct core_string once (normalization collapses e.g.
+        # "ACME INC" and "Acme Incorporated"), so scans touch fewer rows
+        self._n_b = len(rows)
+        unique_rows, b_row = np.unique(rows, return_inverse=True)
+        if len(unique_rows) < len(rows):
+            rows = unique_rows
+            self._b_row = b_row
+            self._row_members = np.argsort(b_row, kind="stable")
+            self._row_start = np.zeros(len(rows) + 1, dtype=np.intp)
+            np.cumsum(np.bincount(b_row, minlength=len(rows)), out=self._row_start[1:])
+            log.info("embedding_rows_deduplicated", names=self._n_b, rows=len(rows))
+        else:
+            self._b_row = self._row_members = self._row_start = None
+
+        # Fancy indexing gathers straight into a fresh float32 (N, D) array;
+        # normalize it in place so no second N x D buffer is allocated.
+        # einsum fuses square-and-sum per row (np.linalg.norm materializes
+        # an N x D squared temporary first).
+        self._embeddings = self._cache_matrix[rows]
+        norms = np.einsum("ij,ij->i", self._embeddings, self._embeddings)
+        np.sqrt(norms, out=norms)
+        np.maximum(norms, 1e-12, out=norms)  # zero rows stay zero
+        self._embeddings /= norms[:, None]
+        log.info("embeddings_normalized", shape=self._embeddings.shape)
 
-        all_embeddings = self._batch_embed(core_strings, label="B")
+        self._hnsw = self._build_hnsw(self._embeddings)
+        if self._hnsw is None and self.config.quantization == "binary":
+            # 1 bit per dimension (sign): 32x fewer bytes to scan than float32
+            self._packed = np.packbits(self._embeddings > 0, axis=1)
 
-        self._embeddings = np.array(all_embeddings, dtype=np.float32)
-        # Normalize for cosine similarity
-        norms = np.linalg.norm(self._embeddings, axis=1, keepdims=True)
-        norms = np.where(norms == 0, 1, norms)
-        self._embeddings = self._embeddings / norms
-        log.info("embeddings_normalized", shape=self._embeddings.shape)
+    def _build_hnsw(self, embeddings: np.ndarray):
+        """Build an HNSW index over normalized embeddings, if worthwhile.
+
+        Returns None when hnswlib is not installed or the catalog is small
+        enough that a brute-force matmul is faster.
+        """
+        n, dim = embeddings.shape
+        if hnswlib is None or n < self.config.hnsw_min_size:
+            return None
+
+        hnsw = hnswlib.Index(space="cosine", dim=dim)
+        hnsw.init_index(
+            max_elements=n,
+            ef_construction=self.config.hnsw_ef_construction,
+            M=self.config.hnsw_m,
+        )
+        hnsw.add_items(embeddings, np.arange(n))
+        hnsw.set_ef(max(self.config.hnsw_ef_construction, self.config.ann_neighbors))
+        log.info("hnsw_index_built", elements=n, dim=dim)
+        return hnsw
 
     def precompute(self, core_strings: list[str]) -> None:
         """Pre-compute and cache embeddings for a list of strings (e.g., A names).
@@ -62,50 +177,60 @@ class EmbeddingIndex:
             return
         self._batch_embed(core_strings, label="A")
 
-    def _batch_embed(self, core_strings: list[str], label: str = "") -> list[list[float]]:
-        """Batch embed strings, using cache where possible."""
-        all_embeddings: list[list[float]] = []
-        to_compute: list[tuple[int, str]] = []
+    def _batch_embed(self, core_strings: list[str], label: str = "") -> np.ndarray:
+        """Batch embed strings, using cache where possible.
+
+        Returns the cache row index for each input string.
+        """
+        rows = np.empty(len(core_strings), dtype=np.intp)
+        # Distinct uncached strings -> input positions (many names share a core)
+        pending: dict[str, list[int]] = {}
 
         for i, cs in enumerate(core_strings):
-            if cs in self._cache:
-                all_embeddings.append(self._cache[cs])
+            row = self._cache.get(cs)
+            if row is not None:
+                rows[i] = row
                 self.cache_hits += 1
             else:
-                all_embeddings.append([])  # placeholder
-                to_compute.append((i, cs))
+                pending.setdefault(cs, []).append(i)
+        to_compute = list(pending)
 
         log.info(
             "embedding_batch_plan",
             label=label,
             total=len(core_strings),
-            from_cache=len(core_strings) - len(to_compute),
+            from_cache=len(core_strings) - sum(map(len, pending.values())),
             to_compute=len(to_compute),
         )
 
-        # Batch compute missing embeddings
+        # Batch compute missing embeddings, keeping up to max_concurrency
+        # requests in flight (the provider call is blocking network I/O)
         if to_compute:
-            total_batches = (len(to_compute) + self.config.batch_size - 1) // self.config.batch_size
-            for batch_num, batch_start in enumerate(range(0, len(to_compute), self.config.batch_size)):
-                batch = to_compute[batch_start : batch_start + self.config.batch_size]
-                texts = [cs for _, cs in batch]
-                log.info(
-                    "embedding_api_call",
-                    label=label,
-                    batch=batch_num + 1,
-                    total_batches=total_batches,
-                    batch_size=len(batch),
-                )
-                embeddings = self.provider.embed_batch(texts)
-                self.api_calls += 1
-                for (idx, cs), emb in zip(batch, embeddings):
-                    all_embeddings[idx] = emb
-                    self._cache[cs] = emb
+            size = self.config.batch_size
+            batches = [to_compute[i : i + size] for i in range(0, len(to_compute), size)]
+            pool = ThreadPoolExecutor(max_workers=min(self.config.max_concurrency, len(batches)))
+            try:
+                # map() yields in submission order; cache writes stay on this thread
+                responses = pool.map(self.provider.embed_batch, batches)
+                for batch_num, (batch, embeddings) in enumerate(zip(batches, responses)):
+                    log.info(
+                        "embedding_api_call",
+                        label=label,
+                        batch=batch_num + 1,
+                        total_batches=len(batches),
+                        batch_size=len(batch),
+                    )
+                    self.api_calls += 1
+                    start = self._cache_extend(batch, np.asarray(embeddings, dtype=np.float32))
+                    for row, cs in enumerate(batch, start):
+                        rows[pending[cs]] = row
+            finally:
+                pool.shutdown(cancel_futures=True)
 
             self._save_cache()
             log.info("embedding_cache_saved", total_cached=len(self._cache))
 
-        return all_embeddings
+        return rows
 
     def query(self, core_string: str) -> tuple[list[int], list[float]]:
         """Find ANN neighbors for a query core_string.
@@ -115,67 +240,262 @@ class EmbeddingIndex:
         if self._embeddings is None or self.provider is None:
             return [], []
 
-        # Get embedding for query (should be cached from precompute)
-        if core_string in self._cache:
-            query_emb = np.array(self._cache[core_string], dtype=np.float32)
-        else:
-            log.warning("embedding_cache_miss_query", core_string=core_string[:50])
-            embeddings = self.provider.embed_batch([core_string])
-            query_emb = np.array(embeddings[0], dtype=np.float32)
-            self._cache[core_string] = embeddings[0]
+        query_emb = self._query_vector(core_string)
+        n = len(self._embeddings)
+        k = min(self.config.ann_neighbors, n)
 
-        # Normalize
-        norm = np.linalg.norm(query_emb)
-        if norm > 0:
-            query_emb = query_emb / norm
+        if self._hnsw is not None:
+            labels, distances = self._hnsw.knn_query(query_emb, k=k)
+            return self._to_b_ids(labels[0].tolist(), (1 - distances[0]).tolist())
+
+        if self._packed is not None:
+            return self._to_b_ids(*self._query_binary(query_emb, k))
+
+        if _HAS_NUMBA and n >= self.config.jit_min_size:
+            # Only large catalogs start Numba's thread pool
+            top_indices, top_sims = _topk_cosine(
+                self._embeddings, np.ascontiguousarray(query_emb, dtype=np.float32), k
+            )
+            return self._to_b_ids(top_indices.tolist(), top_sims.tolist())
 
         # Compute cosine similarities (dot product of normalized vectors)
         similarities = self._embeddings @ query_emb
 
-        # Get top-k neighbors
-        k = min(self.config.ann_neighbors, len(similarities))
-        top_indices = np.argpartition(similarities, -k)[-k:]
-        top_indices = top_indices[np.argsort(similarities[top_indices])[::-1]]
+        # Get top-k neighbors; when every row is wanted a plain sort suffices
+        if k >= n:
+            top_indices = np.argsort(-similarities)
+        else:
+            top_indices = np.argpartition(similarities, -k)[-k:]
+            top_indices = top_indices[np.argsort(-similarities[top_indices])]
 
-        return top_indices.tolist(), similarities[top_indices].tolist()
+        return self._to_b_ids(top_indices.tolist(), similarities[top_indices].tolist())
+
+    def query_batch(self, core_strings: list[str]) -> list[tuple[list[int], list[float]]]:
+        """query() for many core_strings at once, in input order.
+
+        The brute-force and HNSW paths score a block of queries per call (one
+        matrix-matrix product / one knn_query) instead of one per name.
+        """
+        if self._embeddings is None or self.provider is None:
+            return [([], []) for _ in core_strings]
+        if not core_strings:
+            return []
+
+        n = len(self._embeddings)
+        k = min(self.config.ann_neighbors, n)
+        queries = np.stack([self._query_vector(cs) for cs in core_strings])
+
+        if self._hnsw is not None:
+            labels, distances = self._hnsw.knn_query(queries, k=k)
+            return [
+                self._to_b_ids(ids, sims)
+                for ids, sims in zip(labels.tolist(), (1 - distances).tolist())
+            ]
+
+        if self._packed is not None or (
+            _HAS_NUMBA and n >= self.config.jit_min_size
+        ):
+            # Binary and Numba scans already stream the catalog per query
+            return [self.query(cs) for cs in core_strings]
+
+        # Bound the (block x N) similarity matrix to ~64 MB of float32
+        block = max(1, (1 << 24) // n)
+        results: list[tuple[list[int], list[float]]] = []
+        for start in range(0, len(queries), block):
+            similarities = queries[start : start + block] @ self._embeddings.T
+            if k >= n:
+                top = np.argsort(-similarities, axis=1)
+            else:
+                top = np.argpartition(similarities, -k, axis=1)[:, -k:]
+                order = np.argsort(-np.take_along_axis(similarities, top, axis=1), axis=1)
+                top = np.take_along_axis(top, order, axis=1)
+            top_sims = np.take_along_axis(similarities, top, axis=1)
+            results.extend(map(self._to_b_ids, top.tolist(), top_sims.tolist()))
+        return results
+
+    def _to_b_ids(self, rows: list[int], sims: list[float]) -> tuple[list[int], list[float]]:
+        """Expand ranked index rows to the B names sharing them, capped at ann_neighbors."""
+        if self._b_row is None:
+            return rows, sims
+        k = min(self.config.ann_neighbors, self._n_b)
+        b_ids: list[int] = []
+        b_sims: list[float] = []
+        for row, sim in zip(rows, sims):
+            members = self._row_members[self._row_start[row] : self._row_start[row + 1]]
+            b_ids.extend(members.tolist())
+            b_sims.extend([sim] * len(members))
+            if len(b_ids) >= k:
+                break
+        return b_ids[:k], b_sims[:k]
+
+    def _query_vector(self, core_string: str) -> np.ndarray:
+        """Unit-length query embedding (should be cached from precompute)."""
+        if core_string not in self._cache:
+            log.warning("embedding_cache_miss_query", core_string=core_string[:50])
+        return self._get_normalized(core_string)
+
+    def _query_binary(self, query_emb: np.ndarray, k: int) -> tuple[list[int], list[float]]:
+        """Shortlist by Hamming distance on sign bits, then rerank exactly."""
+        distances = _hamming(self._packed, np.packbits(query_emb > 0))
+        shortlist_k = min(k * self.config.binary_oversample, len(distances))
+        shortlist = np.argpartition(distances, shortlist_k - 1)[:shortlist_k]
+
+        similarities = self._embeddings[shortlist] @ query_emb
+        order = np.argsort(similarities)[::-1][:k]
+        return shortlist[order].tolist(), similarities[order].tolist()
 
     def cosine_similarity(self, core_string_a: str, core_string_b: str) -> float | None:
         """Compute cosine similarity between two core strings."""
         if self.provider is None:
             return None
 
-        emb_a = self._get_or_compute(core_string_a)
-        emb_b = self._get_or_compute(core_string_b)
+        emb_a = self._get_normalized(core_string_a)
+        emb_b = self._get_normalized(core_string_b)
 
         if emb_a is None or emb_b is None:
             return None
 
-        a = np.array(emb_a, dtype=np.float32)
-        b = np.array(emb_b, dtype=np.float32)
-
-        norm_a = np.linalg.norm(a)
-        norm_b = np.linalg.norm(b)
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
+        # Zero vectors stay zero after normalization, giving 0.0 as before
+        return float(emb_a @ emb_b)
 
-        return float(np.dot(a, b) / (norm_a * norm_b))
+    def similarities(self, core_string: str, b_ids: list[int]) -> list[float] | None:
+        """Cosine similarity of core_string to each indexed B row in b_ids.
 
-    def _get_or_compute(self, core_string: str) -> list[float] | None:
-        if core_string in self._cache:
-            return self._cache[core_string]
+        One gather + matrix-vector product for a whole candidate list.
+        Returns None when no B index has been built.
+        """
+        if self._embeddings is None or self.provider is None:
+            return None
+        query_emb = self._get_normalized(core_string)
+        if query_emb is None:
+            return None
+        rows = b_ids if self._b_row is None else self._b_row[b_ids]
+        return (self._embeddings[rows] @ query_emb).tolist()
+
+    def _get_normalized(self, core_string: str) -> np.ndarray | None:
+        """Unit-length embedding for a core string, cached after first use."""
+        normalized = self._norm_cache.get(core_string)
+        if normalized is not None:
+            return normalized
+        emb = self._get_or_compute(core_string)
+        if emb is None:
+            return None
+        normalized = np.array(emb, dtype=np.float32)
+        norm = np.linalg.norm(normalized)
+        if norm > 0:
+            normalized /= norm
+        self._norm_cache[core_string] = normalized
+        return normalized
+
+    def _get_or_compute(self, core_string: str) -> np.ndarray | None:
+        row = self._cache.get(core_string)
+        if row is not None:
+            return self._cache_matrix[row]
         if self.provider is None:
             return None
         log.warning("embedding_cache_miss_compute", core_string=core_string[:50])
         embeddings = self.provider.embed_batch([core_string])
-        self._cache[core_string] = embeddings[0]
-        return embeddings[0]
+        row = self._cache_put(core_string, embeddings[0])
+        return self._cache_matrix[row]
+
+    def _cache_put(self, core_string: str, embedding: list[float]) -> int:
+        """Write an embedding into the next free cache row and return its index."""
+        existing = self._cache.get(core_string)
+        if existing is not None:
+            # Keys and rows must stay one-to-one for the persisted layout
+            return existing
+        return self._cache_extend([core_string], np.asarray([embedding], dtype=np.float32))
+
+    def _cache_extend(self, core_strings: list[str], embeddings: np.ndarray) -> int:
+        """Append rows for distinct, uncached core_strings; return the first row index.
+
+        The whole (n, D) block is copied with one slice assignment, so API
+        responses are never unpacked float by float.
+        """
+        n, dim = embeddings.shape
+        needed = self._cache_rows + n
+        if self._cache_matrix is None:
+            self._cache_matrix = np.empty((max(64, n), dim), dtype=np.float32)
+        elif needed > len(self._cache_matrix) or not self._cache_matrix.flags.writeable:
+            # Grow (and detach from a read-only memmap) with amortized doubling
+            capacity = max(64, 2 * self._cache_rows, needed)
+            grown = np.empty((capacity, dim), dtype=np.float32)
+            grown[: self._cache_rows] = self._cache_matrix[: self._cache_rows]
+            self._cache_matrix = grown
+
+        start = self._cache_rows
+        self._cache_matrix[start:needed] = embeddings
+        self._cache_rows = needed
+        for row, cs in enumerate(core_strings, start):
+            self._cache[cs] = row
+        self._dirty.extend(core_strings)
+        return start
 
     def _load_cache(self) -> None:
-        cache_file = self._cache_dir / "embedding_cache.json"
-        if cache_file.exists():
-            self._cache = json.loads(cache_file.read_text())
+        # Append-only layout: raw float32 rows plus one JSON key per row.
+        # The first line of the keys file records the embedding dimension.
+        matrix_file = self._cache_dir / "embedding_cache.f32"
+        keys_file = self._cache_dir / "embedding_cache_keys.jsonl"
+        if matrix_file.exists() and keys_file.exists():
+            with keys_file.open("rb") as f:
+                header = loads(f.readline())
+                keys = [loads(line) for line in f if line.strip()]
+            dim = header["dim"]
+            row_bytes = 4 * dim
+            # Rows are written before keys, so a crash can only leave extra rows
+            size = matrix_file.stat().st_size
+            if len(keys) * row_bytes > size:
+                log.warning("embedding_cache_corrupt", keys=len(keys), rows=size // row_bytes)
+                return
+            if len(keys) * row_bytes < size:
+                # Drop orphaned rows so later appends line up with their keys
+                log.warning("embedding_cache_truncated", orphan_bytes=size - len(keys) * row_bytes)
+                os.truncate(matrix_file, len(keys) * row_bytes)
+            self._cache = {key: row for row, key in enumerate(keys)}
+            self._cache_matrix = (
+                np.memmap(matrix_file, dtype=np.float32, mode="r", shape=(len(keys), dim))
+                if keys
+                else None
+            )
+            self._cache_rows = self._saved_rows = len(keys)
+            self._dirty = []
+            return
+
+        # Migrate the legacy JSON cache (core_string -> list of floats)
+        legacy_file = self._cache_dir / "embedding_cache.json"
+        if legacy_file.exists():
+            self._cache = {}
+            self._cache_matrix = None
+            self._cache_rows = self._saved_rows = 0
+            self._dirty = []
+            for key, emb in loads(legacy_file.read_bytes()).items():
+                self._cache_put(key, emb)
 
     def _save_cache(self) -> None:
+        """Append rows added since the last save; existing rows are never rewritten."""
+        if self._cache_matrix is None or not self._dirty:
+            return
         self._cache_dir.mkdir(parents=True, exist_ok=True)
-        cache_file = self._cache_dir / "embedding_cache.json"
-        cache_file.write_text(json.dumps(self._cache))
+        matrix_file = self._cache_dir / "embedding_cache.f32"
+        keys_file = self._cache_dir / "embedding_cache_keys.jsonl"
+
+        new_rows = np.ascontiguousarray(self._cache_matrix[self._saved_rows : self._cache_rows])
+        new_keys = b"".join(dumps(key) + b"\n" for key in self._dirty)
+
+        if self._saved_rows == 0:
+            # Fresh cache: write to temp files and rename, so a live memmap of
+            # a previous cache file is never truncated underneath us.
+            matrix_tmp = matrix_file.with_name(matrix_file.name + ".tmp")
+            keys_tmp = keys_file.with_name(keys_file.name + ".tmp")
+            matrix_tmp.write_bytes(new_rows.tobytes())
+            keys_tmp.write_bytes(dumps({"dim": self._cache_matrix.shape[1]}) + b"\n" + new_keys)
+            matrix_tmp.replace(matrix_file)
+            keys_tmp.replace(keys_file)
+        else:
+            with matrix_file.open("ab") as f:
+                f.write(new_rows.tobytes())
+            with keys_file.open("ab") as f:
+                f.write(new_keys)
+
+        self._saved_rows = self._cache_rows
+        self._dirty = []
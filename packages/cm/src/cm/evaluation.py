@@ -39,12 +39,19 @@ def load_labeled_pairs(path: str | Path) -> list[LabeledPair]:
     path = Path(path)
     pairs: list[LabeledPair] = []
     with path.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return pairs
+        columns = {name: i for i, name in enumerate(header)}
+        a_idx, b_idx, label_idx = columns["name_a"], columns["name_b"], columns["label"]
         for row in reader:
+            if not row:
+                continue
             pairs.append(LabeledPair(
-                name_a=row["name_a"].strip(),
-                name_b=row["name_b"].strip(),
-                label=int(row["label"]),
+                name_a=row[a_idx].strip(),
+                name_b=row[b_idx].strip(),
+                label=int(row[label_idx]),
             ))
     return pairs
 
@@ -62,8 +69,10 @@ def evaluate(
     metrics = EvalMetrics(total_pairs=len(pairs))
     fp_reasons: Counter[str] = Counter()
 
+    # One matcher for all pairs; only the single-name B index is rebuilt
+    matcher = Matcher(config)
     for pair in pairs:
-        matcher = Matcher(config)
+        matcher.reset_b()
         matcher.preprocess_b([pair.name_b])
         result = matcher.match_one(pair.name_a)
 
@@ -111,15 +120,20 @@ def evaluate_batch(
     b_names: list[str],
     labeled_matches: dict[int, int],
     config: MatchConfig | None = None,
+    workers: int = 1,
 ) -> tuple[EvalMetrics, list[MatchResult]]:
     """Evaluate on full A/B lists with known matches.
 
     labeled_matches: dict mapping a_id -> b_id for known matches.
+    workers: processes to shard A scoring across (opt-in). Small inputs
+        are always matched in-process; LLM arbitration of REVIEW results
+        runs in this process after the workers finish.
     """
     config = config or MatchConfig()
     matcher = Matcher(config)
     matcher.preprocess_b(b_names)
-    results = matcher.match_all(a_names)
+
+    results = matcher.match_all(a_names, workers=workers)
 
     metrics = EvalMetrics(total_pairs=len(results))
     fp_reasons: Counter[str] = Counter()
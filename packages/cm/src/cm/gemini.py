@@ -2,15 +2,40 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import subprocess
+import time
+from collections.abc import Callable
+from typing import TypeVar
 
 import structlog
 from google import genai
+from google.genai import errors
 
 log = structlog.get_logger()
 
+T = TypeVar("T")
 
+# Rate limiting and transient server failures; anything else is a real error
+_RETRY_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def _with_retries(call: Callable[[], T], attempts: int = 5, initial_delay: float = 1.0) -> T:
+    """Run call, retrying transient API errors with exponential backoff."""
+    for attempt in range(attempts):
+        try:
+            return call()
+        except errors.APIError as exc:
+            if exc.code not in _RETRY_STATUS or attempt == attempts - 1:
+                raise
+            delay = initial_delay * 2**attempt
+            log.warning("gemini_retry", status=exc.code, attempt=attempt + 1, delay=delay)
+            time.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+@functools.lru_cache(maxsize=1)
 def _get_project() -> str:
     project = os.environ.get("GOOGLE_CLOUD_PROJECT")
     if project:
@@ -31,7 +56,10 @@ def _get_project() -> str:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def _make_client() -> genai.Client:
+    # One client per process: the embedding and LLM providers share its
+    # connection pool, and `gcloud` is spawned at most once
     project = _get_project()
     location = os.environ.get("GOOGLE_CLOUD_LOCATION", "us-central1")
     return genai.Client(vertexai=True, project=project, location=location)
@@ -41,16 +69,22 @@ class GeminiEmbeddingProvider:
     """EmbeddingProvider backed by Gemini text-embedding-004."""
 
     MODEL = "text-embedding-004"
+    MAX_BATCH = 250  # Vertex AI limit: 250 texts per request
 
     def __init__(self, client: genai.Client | None = None) -> None:
         self._client = client or _make_client()
 
     def embed_batch(self, texts: list[str]) -> list[list[float]]:
-        result = self._client.models.embed_content(
-            model=self.MODEL,
-            contents=texts,
-        )
-        return [e.values for e in result.embeddings]
+        # EmbeddingIndex already slices to EmbeddingConfig.batch_size and runs
+        # slices concurrently; this guards direct callers against the limit
+        embeddings: list[list[float]] = []
+        for start in range(0, len(texts), self.MAX_BATCH):
+            chunk = texts[start : start + self.MAX_BATCH]
+            result = _with_retries(
+                lambda: self._client.models.embed_content(model=self.MODEL, contents=chunk)
+            )
+            embeddings.extend(e.values for e in result.embeddings)
+        return embeddings
 
 
 class GeminiLLMProvider:
@@ -62,8 +96,7 @@ class GeminiLLMProvider:
         self._client = client or _make_client()
 
     def query(self, prompt: str) -> str:
-        response = self._client.models.generate_content(
-            model=self.MODEL,
-            contents=prompt,
+        response = _with_retries(
+            lambda: self._client.models.generate_content(model=self.MODEL, contents=prompt)
         )
         return response.text
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 
+import numpy as np
 import structlog
 
 from cm.config import CandidateConfig
@@ -17,24 +18,39 @@ class BlockingIndex:
 
     def __init__(self, config: CandidateConfig | None = None) -> None:
         self.config = config or CandidateConfig()
-        self._index: dict[str, set[int]] = defaultdict(set)
+        # Posting lists: key type -> key value -> sorted int32 array of B IDs.
+        # Every blocking key (prefix2, prefix3, first token, ...) is
+        # precomputed, so lookups are exact hash probes, never prefix scans.
+        self._index: dict[str, dict[str, np.ndarray]] = {}
         self._names: dict[int, NormalizedName] = {}
 
     def build(self, names: list[NormalizedName]) -> None:
         """Build the inverted index from a list of B names."""
+        postings: dict[str, dict[str, list[int]]] = defaultdict(lambda: defaultdict(list))
         for b_id, name in enumerate(names):
             self._names[b_id] = name
             for key_type, key_value in name.keys.items():
                 if key_type == "k_first" and not self.config.use_k_first:
                     continue
-                composite_key = f"{key_type}::{key_value}"
-                self._index[composite_key].add(b_id)
+                postings[key_type][key_value].append(b_id)
+        # B IDs are appended in increasing order, so each array is already sorted
+        self._index = {
+            key_type: {
+                key: np.array(b_ids, dtype=np.int32) for key, b_ids in by_value.items()
+            }
+            for key_type, by_value in postings.items()
+        }
         log.info(
             "blocking_index_built",
             names_indexed=len(names),
-            unique_keys=len(self._index),
+            unique_keys=sum(len(by_value) for by_value in self._index.values()),
         )
 
+    def clear(self) -> None:
+        """Remove all indexed B names, keeping the configuration."""
+        self._index.clear()
+        self._names.clear()
+
     def get_name(self, b_id: int) -> NormalizedName:
         """Get the NormalizedName for a B ID."""
         return self._names[b_id]
@@ -48,33 +64,40 @@ class BlockingIndex:
 
         Returns deduplicated candidates with source tracking, capped at limits.
         """
-        candidates: dict[int, set[str]] = defaultdict(set)
-
-        # Lexical blocking
+        # Lexical blocking: collect matching posting lists
+        matched: list[tuple[str, np.ndarray]] = []
         for key_type, key_value in a_name.keys.items():
             if key_type == "k_first" and not self.config.use_k_first:
                 continue
-            composite_key = f"{key_type}::{key_value}"
-            for b_id in self._index.get(composite_key, set()):
-                candidates[b_id].add(key_type)
-
-        # Apply lexical cap
-        lexical_ids = list(candidates.keys())
-        if len(lexical_ids) > self.config.max_candidates_lexical:
-            # Prioritize candidates with more sources
-            lexical_ids.sort(
-                key=lambda bid: len(candidates[bid]), reverse=True
-            )
-            lexical_ids = lexical_ids[: self.config.max_candidates_lexical]
-            candidates = {
-                bid: candidates[bid]
-                for bid in lexical_ids
-            }
+            by_value = self._index.get(key_type)
+            postings = by_value.get(key_value) if by_value is not None else None
+            if postings is not None:
+                matched.append((key_type, postings))
+
+        candidates: dict[int, set[str]] = {}
+        if matched:
+            # Count sources per B ID in one vectorized pass
+            all_ids = np.concatenate([postings for _, postings in matched])
+            lexical_ids, source_counts = np.unique(all_ids, return_counts=True)
+
+            # Apply lexical cap, prioritizing candidates with more sources
+            capped = len(lexical_ids) > self.config.max_candidates_lexical
+            if capped:
+                keep = np.argsort(-source_counts, kind="stable")
+                lexical_ids = lexical_ids[keep[: self.config.max_candidates_lexical]]
+
+            # Source sets are only materialized for the surviving candidates
+            candidates = {b_id: set() for b_id in lexical_ids.tolist()}
+            for key_type, postings in matched:
+                if capped:
+                    postings = postings[np.isin(postings, lexical_ids)]
+                for b_id in postings.tolist():
+                    candidates[b_id].add(key_type)
 
         # Union with embedding candidates
         if embedding_candidates:
             for b_id in embedding_candidates[: self.config.max_candidates_embedding]:
-                candidates[b_id].add("embedding")
+                candidates.setdefault(b_id, set()).add("embedding")
 
         # Apply total cap
         if len(candidates) > self.config.max_candidates_total:
@@ -1,13 +1,123 @@
-"""CSV/JSONL input and output for company name matching."""
+"""CSV/JSONL/Excel input and output for company name matching."""
 
 from __future__ import annotations
 
 import csv
+import hashlib
 import json
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from cm.types import MatchResult
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json fallback
+    orjson = None
+
+try:
+    import python_calamine  # noqa: F401  (backs pandas' "calamine" engine)
+except ImportError:  # optional: openpyxl fallback
+    python_calamine = None
+
+try:
+    import xlsxwriter  # noqa: F401
+except ImportError:  # optional: openpyxl fallback
+    xlsxwriter = None
+
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def dumps(obj: object, *, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when available.
+
+    Compact by default; indent=True pretty-prints with two spaces.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def loads(data: str | bytes) -> object:
+    """Parse JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_excel(
+    path: str | Path,
+    usecols: list[str] | None = None,
+    cache_dir: str | Path | None = None,
+) -> pd.DataFrame:
+    """Read the first sheet of an .xlsx file.
+
+    Uses the Rust calamine reader when python-calamine is installed, which
+    parses large sheets several times faster than openpyxl. usecols limits
+    the columns converted into the DataFrame.
+
+    With cache_dir set, the parsed frame is pickled there keyed by the
+    file's mtime and size, so re-reading an unchanged workbook skips
+    XLSX parsing entirely.
+    """
+    import pandas as pd
+
+    cache_path = _excel_cache_path(Path(path), usecols, Path(cache_dir)) if cache_dir else None
+    if cache_path is not None and cache_path.exists():
+        return pd.read_pickle(cache_path)
+
+    engine = "calamine" if python_calamine is not None else None
+    df = pd.read_excel(path, engine=engine, usecols=usecols)
+
+    if cache_path is not None:
+        # Drop entries for older versions of the same workbook
+        for stale in cache_path.parent.glob(f"{cache_path.name.split('_', 1)[0]}_*.pkl"):
+            stale.unlink(missing_ok=True)
+        tmp = cache_path.with_suffix(".tmp")
+        df.to_pickle(tmp)
+        tmp.replace(cache_path)
+    return df
+
+
+def _excel_cache_path(path: Path, usecols: list[str] | None, cache_dir: Path) -> Path:
+    stat = path.stat()
+    source = hashlib.sha1(f"{path.resolve()}|{usecols}".encode()).hexdigest()[:16]
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir / f"{source}_{stat.st_mtime_ns}_{stat.st_size}.pkl"
+
+
+def write_excel(df: pd.DataFrame, path: str | Path) -> None:
+    """Write a DataFrame to .xlsx without the index.
+
+    With xlsxwriter installed, rows are streamed in constant-memory mode
+    (each row is flushed to disk once written) instead of building an
+    openpyxl cell tree for the whole sheet.
+    """
+    if xlsxwriter is None:
+        df.to_excel(path, index=False)
+        return
+
+    # pandas' own xlsxwriter path emits cells column by column, which
+    # constant_memory mode cannot accept, so rows are written directly.
+    # Missing values become blank cells; object dtype yields Python scalars.
+    values = df.astype(object).where(df.notna(), None)
+    workbook = xlsxwriter.Workbook(str(path), {"constant_memory": True})
+    try:
+        sheet = workbook.add_worksheet()
+        sheet.write_row(0, 0, [str(col) for col in df.columns])
+        for row_num, row in enumerate(values.itertuples(index=False, name=None), 1):
+            sheet.write_row(row_num, 0, row)
+    finally:
+        workbook.close()
+
 
 def read_names(path: str | Path, name_column: str = "name", id_column: str | None = "id") -> list[tuple[int, str]]:
     """Read company names from CSV or JSONL.
@@ -25,13 +135,19 @@ def read_names(path: str | Path, name_column: str = "name", id_column: str | Non
 def _read_csv(path: Path, name_column: str, id_column: str | None) -> list[tuple[int, str]]:
     results: list[tuple[int, str]] = []
     with path.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for i, row in enumerate(reader):
-            name = row.get(name_column, "").strip()
+        reader = csv.reader(f)
+        header = next(reader, [])
+        if name_column not in header:
+            return results
+        name_idx = header.index(name_column)
+        id_idx = header.index(id_column) if id_column and id_column in header else None
+        # Blank lines are skipped without advancing the row index, as DictReader does
+        for i, row in enumerate(row for row in reader if row):
+            name = row[name_idx].strip() if name_idx < len(row) else ""
             if not name:
                 continue
-            if id_column and id_column in row:
-                item_id = int(row[id_column])
+            if id_idx is not None:
+                item_id = int(row[id_idx])
             else:
                 item_id = i
             results.append((item_id, name))
@@ -78,30 +194,30 @@ def _write_csv(results: list[MatchResult], path: Path, include_debug: bool) -> N
     if include_debug:
         fieldnames.extend(["warnings", "top_candidates"])
 
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    with path.open("w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
         for r in results:
-            row = {
-                "a_id": r.a_id,
-                "a_name": r.a_name,
-                "b_id": r.b_id if r.b_id is not None else "",
-                "b_name": r.b_name or "",
-                "decision": r.decision,
-                "score": f"{r.score:.4f}",
-                "runner_up_score": f"{r.runner_up_score:.4f}" if r.runner_up_score is not None else "",
-                "margin": f"{r.margin:.4f}" if r.margin is not None else "",
-                "used_llm": r.used_llm,
-                "reasons": "|".join(r.reasons),
-            }
+            row = [
+                r.a_id,
+                r.a_name,
+                r.b_id if r.b_id is not None else "",
+                r.b_name or "",
+                r.decision,
+                f"{r.score:.4f}",
+                f"{r.runner_up_score:.4f}" if r.runner_up_score is not None else "",
+                f"{r.margin:.4f}" if r.margin is not None else "",
+                r.used_llm,
+                "|".join(r.reasons),
+            ]
             if include_debug:
-                row["warnings"] = "|".join(r.debug.get("warnings", []))
-                row["top_candidates"] = json.dumps(r.debug.get("top_candidates", []))
+                row.append("|".join(r.debug.get("warnings", [])))
+                row.append(dumps(r.debug.get("top_candidates", [])).decode())
             writer.writerow(row)
 
 
 def _write_jsonl(results: list[MatchResult], path: Path, include_debug: bool) -> None:
-    with path.open("w", encoding="utf-8") as f:
+    with path.open("wb", buffering=_WRITE_BUFFER_SIZE) as f:
         for r in results:
             record = {
                 "a_id": r.a_id,
@@ -117,4 +233,4 @@ def _write_jsonl(results: list[MatchResult], path: Path, include_debug: bool) ->
             }
             if include_debug:
                 record["debug"] = r.debug
-            f.write(json.dumps(record) + "\n")
+            f.write(dumps(record) + b"\n")
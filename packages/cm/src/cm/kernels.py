@@ -0,0 +1,52 @@
+"""Numba kernels for large-catalog embedding scans (optional `jit` extra).
+
+Imported lazily by cm.embeddings, so numba is only loaded once a catalog
+reaches EmbeddingConfig.jit_min_size.
+"""
+
+from __future__ import annotations
+
+import numba
+import numpy as np
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _topk_cosine_chunked(
+    embeddings: np.ndarray, query: np.ndarray, k: int, n_chunks: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Fused dot-product + top-k over rows, without an N-length score buffer.
+
+    Each parallel chunk keeps its own ascending top-k list; the
+    n_chunks * k survivors are merged at the end. Requires k <= N.
+    """
+    n, d = embeddings.shape
+    chunk = (n + n_chunks - 1) // n_chunks
+    best_idx = np.full((n_chunks, k), -1, np.int64)
+    best_sim = np.full((n_chunks, k), -np.inf, np.float32)
+    for c in numba.prange(n_chunks):
+        idx = best_idx[c]
+        sim = best_sim[c]
+        for i in range(c * chunk, min(n, (c + 1) * chunk)):
+            s = np.float32(0.0)
+            for j in range(d):
+                s += embeddings[i, j] * query[j]
+            if s > sim[0]:
+                # Insert, shifting smaller entries down; sim[0] is the minimum
+                p = 0
+                while p + 1 < k and sim[p + 1] < s:
+                    sim[p] = sim[p + 1]
+                    idx[p] = idx[p + 1]
+                    p += 1
+                sim[p] = s
+                idx[p] = i
+    flat_sim = best_sim.ravel()
+    flat_idx = best_idx.ravel()
+    order = np.argsort(flat_sim)[::-1][:k]
+    return flat_idx[order], flat_sim[order]
+
+
+def topk_cosine(
+    embeddings: np.ndarray, query: np.ndarray, k: int, n_chunks: int | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Top-k rows of embeddings by dot product with query (one chunk per thread by default)."""
+    return _topk_cosine_chunked(embeddings, query, k, n_chunks or numba.get_num_threads())
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import hashlib
-import json
+import threading
+from pathlib import Path
 from typing import Protocol
 
 import structlog
 
 from cm.config import LLMConfig
+from cm.io import dumps, loads
 from cm.types import Decision, LLMResponse, NormalizedName, ScoredCandidate
 
 log = structlog.get_logger()
@@ -26,13 +27,34 @@ class LLMArbiter:
     def __init__(self, config: LLMConfig, provider: LLMProvider | None = None) -> None:
         self.config = config
         self.provider = provider
-        self._cache: dict[str, LLMResponse] = {}
+        self._cache: dict[tuple[str, str, tuple[str, ...]], LLMResponse] = {}
         self._global_calls: int = 0
+        # Guards the call budget and cache when Matcher arbitrates concurrently
+        self._lock = threading.Lock()
+        self._in_flight: int = 0
+        if config.cache_path:
+            self._load_cache(Path(config.cache_path))
+
+    def __getstate__(self) -> dict:
+        # Worker processes never arbitrate, and provider clients cannot be pickled
+        state = self.__dict__.copy()
+        state["provider"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
 
     @property
     def calls_made(self) -> int:
         return self._global_calls
 
+    def reset_call_count(self) -> None:
+        """Restart the global call cap (the response cache is kept)."""
+        with self._lock:
+            self._global_calls = 0
+
     def is_eligible(
         self,
         a: NormalizedName,
@@ -40,20 +62,18 @@ class LLMArbiter:
         scored: ScoredCandidate,
         runner_up_score: float | None,
     ) -> bool:
-        """Check if this pair passes all LLM gating rules."""
+        """Check if this pair passes all LLM gating rules.
+
+        Scalar checks run first; the numeric-conflict check, the only rule
+        that allocates, runs last.
+        """
         if not self.config.enabled:
             return False
 
         # Rule 1: implicitly satisfied (caller only calls for AMBIGUOUS)
 
-        # Rule 2: No numeric conflict
-        a_nums = set(a.numeric_tokens)
-        b_nums = set(b.numeric_tokens)
-        if a_nums and b_nums and a_nums != b_nums:
-            return False
-
-        # Rule 3: At least one side has core_tokens >= 2
-        if len(a.core_tokens) < 2 and len(b.core_tokens) < 2:
+        # Rule 6: Global cap
+        if self._global_calls >= self.config.global_call_cap:
             return False
 
         # Rule 5: Margin below threshold (close race)
@@ -62,13 +82,20 @@ class LLMArbiter:
             if margin >= self.config.min_confidence:
                 return False
 
-        # Rule 6: Global cap
-        if self._global_calls >= self.config.global_call_cap:
-            return False
+        a_len = len(a.core_tokens)
+        b_len = len(b.core_tokens)
 
         # Rule 7: Both single-token cores forbidden
-        if self.config.forbid_both_single_token:
-            if len(a.core_tokens) == 1 and len(b.core_tokens) == 1:
+        if self.config.forbid_both_single_token and a_len == 1 and b_len == 1:
+            return False
+
+        # Rule 3: At least one side has core_tokens >= 2
+        if a_len < 2 and b_len < 2:
+            return False
+
+        # Rule 2: No numeric conflict
+        if a.numeric_tokens and b.numeric_tokens:
+            if set(a.numeric_tokens) != set(b.numeric_tokens):
                 return False
 
         return True
@@ -85,11 +112,11 @@ class LLMArbiter:
 
         Returns (decision, llm_response).
         """
-        cache_key = self._cache_key(a, b)
+        cache_key = self._cache_key(a, b, strip_categories)
 
-        # Check cache
-        if cache_key in self._cache:
-            response = self._cache[cache_key]
+        # Check cache (a single dict read needs no lock; writes take it)
+        response = self._cache.get(cache_key)
+        if response is not None:
             log.debug("llm_cache_hit", cache_key=cache_key)
             return self._map_response(response), response
 
@@ -98,6 +125,28 @@ class LLMArbiter:
             response = LLMResponse(decision="UNSURE", confidence=0.0, reason="no_provider")
             return "REVIEW", response
 
+        # Reserve a slot under the global cap; with concurrent arbitration
+        # is_eligible alone could let several threads past the last slot
+        with self._lock:
+            if self._global_calls + self._in_flight >= self.config.global_call_cap:
+                response = LLMResponse(decision="UNSURE", confidence=0.0, reason="call_cap")
+                return "REVIEW", response
+            self._in_flight += 1
+        try:
+            return self._call(a, b, scored, runner_up_score, strip_categories, cache_key)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _call(
+        self,
+        a: NormalizedName,
+        b: NormalizedName,
+        scored: ScoredCandidate,
+        runner_up_score: float | None,
+        strip_categories: list[str] | None,
+        cache_key: tuple[str, str, tuple[str, ...]],
+    ) -> tuple[Decision, LLMResponse]:
         # Build prompt
         prompt = self._build_prompt(a, b, scored, runner_up_score, strip_categories)
         log.debug("llm_prompt_built", a_core=a.core_string, b_core=b.core_string)
@@ -111,19 +160,68 @@ class LLMArbiter:
         except Exception as e:
             log.warning("llm_call_failed", error=str(e))
             response = LLMResponse(decision="UNSURE", confidence=0.0, reason="error")
-            self._cache[cache_key] = response
+            with self._lock:
+                self._cache[cache_key] = response
             return "REVIEW", response
 
-        self._global_calls += 1
-        self._cache[cache_key] = response
+        # An unparseable reply is reused for this run only; persisting it
+        # would pin the pair to UNSURE for every later run
+        persist = response is not None and bool(self.config.cache_path)
+        if response is None:
+            response = LLMResponse(decision="UNSURE", confidence=0.0, reason="parse_error")
+        with self._lock:
+            self._global_calls += 1
+            self._cache[cache_key] = response
+            if persist:
+                self._append_cache(Path(self.config.cache_path), cache_key, response)
         log.info("llm_call_complete", global_calls=self._global_calls)
 
         return self._map_response(response), response
 
-    def _cache_key(self, a: NormalizedName, b: NormalizedName) -> str:
-        a_hash = hashlib.sha256(a.core_string.encode()).hexdigest()[:16]
-        b_hash = hashlib.sha256(b.core_string.encode()).hexdigest()[:16]
-        return f"{a_hash}::{b_hash}"
+    def _cache_key(
+        self,
+        a: NormalizedName,
+        b: NormalizedName,
+        strip_categories: list[str] | None = None,
+    ) -> tuple[str, str, tuple[str, ...]]:
+        # The strings themselves are the key: their hashes are cached by
+        # CPython and equality is exact (no truncated-digest collisions).
+        # Ignored categories change the prompt, so they are part of it.
+        return a.core_string, b.core_string, tuple(strip_categories or ())
+
+    def _load_cache(self, path: Path) -> None:
+        # Append-only JSONL of answered calls; failed calls are never written
+        if not path.exists():
+            return
+        with path.open("rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    rec = loads(line)
+                except ValueError:
+                    continue  # torn final line from an interrupted run
+                key = (rec["a"], rec["b"], tuple(rec["strip"]))
+                self._cache[key] = LLMResponse(
+                    decision=rec["decision"], confidence=rec["confidence"], reason=rec["reason"]
+                )
+        log.info("llm_cache_loaded", path=str(path), cached_count=len(self._cache))
+
+    def _append_cache(
+        self, path: Path, key: tuple[str, str, tuple[str, ...]], response: LLMResponse
+    ) -> None:
+        a_core, b_core, strip = key
+        record = {
+            "a": a_core,
+            "b": b_core,
+            "strip": list(strip),
+            "decision": response.decision,
+            "confidence": response.confidence,
+            "reason": response.reason,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("ab") as f:
+            f.write(dumps(record) + b"\n")
 
     def _map_response(self, response: LLMResponse) -> Decision:
         if response.decision == "SAME" and response.confidence >= self.config.min_confidence:
@@ -174,20 +272,39 @@ class LLMArbiter:
         return (
             "You are a company name matching expert. Determine if these two entries "
             "refer to the SAME company or DIFFERENT companies.\n\n"
-            f"Evidence:\n{json.dumps(evidence, indent=2)}"
+            f"Evidence:\n{dumps(evidence, indent=True).decode()}"
             f"{ignore_instruction}\n\n"
             "Respond with a JSON object:\n"
             '{"decision": "SAME|DIFFERENT|UNSURE", "confidence": 0.0-1.0, "reason": "short_label"}\n'
             "Only output the JSON object, nothing else."
         )
 
-    def _parse_response(self, raw: str) -> LLMResponse:
+    def _parse_response(self, raw: str) -> LLMResponse | None:
+        """Parse a raw reply; None when it is not a usable JSON answer."""
         try:
-            data = json.loads(raw.strip())
+            data = _loads_reply(raw)
             return LLMResponse(
                 decision=data.get("decision", "UNSURE"),
                 confidence=float(data.get("confidence", 0.0)),
                 reason=data.get("reason", ""),
             )
-        except (json.JSONDecodeError, KeyError, TypeError):
-            return LLMResponse(decision="UNSURE", confidence=0.0, reason="parse_error")
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+
+def _loads_reply(raw: str) -> object:
+    """Parse an LLM JSON reply, tolerating ```json fences and surrounding prose.
+
+    The strict parse is tried first; only on failure is the outermost
+    {...} span extracted and parsed again.
+    """
+    text = raw.strip()
+    if text.startswith("```"):
+        text = text.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+    try:
+        return loads(text)
+    except ValueError:
+        start, end = text.find("{"), text.rfind("}")
+        if start == -1 or end <= start:
+            raise
+        return loads(text[start : end + 1])
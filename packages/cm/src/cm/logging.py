@@ -5,6 +5,29 @@ import os
 
 import structlog
 
+# structlog's default configuration emits every level
+_debug_enabled = True
+# Level passed to the last configure_logging call (None: never configured)
+_level: str | None = None
+
+
+def debug_enabled() -> bool:
+    """Whether debug events are emitted.
+
+    Hot loops check this once and skip log.debug calls (and building their
+    arguments) entirely at higher levels.
+    """
+    return _debug_enabled
+
+
+def configured_level() -> str | None:
+    """The level logging was configured with, or None if it never was.
+
+    Worker processes replay it, since spawned interpreters start with
+    structlog's print-everything default.
+    """
+    return _level
+
 
 def configure_logging(level: str | None = None) -> None:
     """Configure structlog with console output.
@@ -16,6 +39,10 @@ def configure_logging(level: str | None = None) -> None:
     log_level = (level or os.environ.get("LOG_LEVEL", "INFO")).upper()
     numeric_level = getattr(logging, log_level, logging.INFO)
 
+    global _debug_enabled, _level
+    _debug_enabled = numeric_level <= logging.DEBUG
+    _level = log_level
+
     # Configure standard library logging
     logging.basicConfig(
         format="%(message)s",
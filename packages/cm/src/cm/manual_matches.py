@@ -1,12 +1,19 @@
 """Manual match storage for the verify UI."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-import json
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 import structlog
 
+from cm.io import dumps, loads
+
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 @dataclass
 class ManualMatch:
@@ -25,22 +32,34 @@ class ManualMatchStore:
 
     path: Path
     matches: list[ManualMatch] = field(default_factory=list)
+    # A name -> (B name, B id), kept in step with matches (later matches win)
+    _a_to_b: dict[str, tuple[str, str | None]] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     def __post_init__(self) -> None:
         self.log = structlog.get_logger()
         if isinstance(self.path, str):
             self.path = Path(self.path)
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self._a_to_b = {
+            a_name: (match.b_name, match.b_id)
+            for match in self.matches
+            for a_name in match.a_names
+        }
 
     def load(self) -> None:
         """Load matches from disk."""
         if not self.path.exists():
             self.log.info("manual_matches_file_not_found", path=str(self.path))
             self.matches = []
+            self._reindex()
             return
 
         try:
-            with open(self.path) as f:
-                data = json.load(f)
+            data = loads(self.path.read_bytes())
 
             self.matches = [
                 ManualMatch(
@@ -53,9 +72,10 @@ class ManualMatchStore:
                 for m in data.get("matches", [])
             ]
             self.log.info("manual_matches_loaded", count=len(self.matches))
-        except (json.JSONDecodeError, KeyError) as e:
+        except (ValueError, KeyError) as e:
             self.log.error("manual_matches_load_error", error=str(e))
             self.matches = []
+        self._reindex()
 
     def save(self) -> None:
         """Save matches to disk."""
@@ -74,8 +94,10 @@ class ManualMatchStore:
             ]
         }
 
-        with open(self.path, "w") as f:
-            json.dump(data, f, indent=2)
+        # Write-then-rename so an interrupted save never truncates the file
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_bytes(dumps(data, indent=True))
+        tmp.replace(self.path)
 
         self.log.info("manual_matches_saved", count=len(self.matches))
 
@@ -95,6 +117,8 @@ class ManualMatchStore:
             notes=notes,
         )
         self.matches.append(match)
+        for a_name in a_names:
+            self._a_to_b[a_name] = (b_name, b_id)
         self.save()
         self.log.info(
             "manual_match_added",
@@ -108,6 +132,13 @@ class ManualMatchStore:
         """Remove a manual match by index."""
         if 0 <= index < len(self.matches):
             removed = self.matches.pop(index)
+            for a_name in removed.a_names:
+                # Fall back to the latest remaining match for this name, if any
+                self._a_to_b.pop(a_name, None)
+                for match in reversed(self.matches):
+                    if a_name in match.a_names:
+                        self._a_to_b[a_name] = (match.b_name, match.b_id)
+                        break
             self.save()
             self.log.info(
                 "manual_match_removed",
@@ -122,10 +153,30 @@ class ManualMatchStore:
         """Get all manual matches."""
         return self.matches
 
-    def get_a_to_b_map(self) -> dict[str, tuple[str, str | None]]:
-        """Get a mapping from A name to (B name, B id) for use in matching."""
-        result: dict[str, tuple[str, str | None]] = {}
-        for match in self.matches:
-            for a_name in match.a_names:
-                result[a_name] = (match.b_name, match.b_id)
-        return result
+    def apply_to_results(self, results_df: "pd.DataFrame") -> int:
+        """Overwrite matching results in place with the manual matches.
+
+        Rows whose A_name has a manual match take its CUP name/ID, decision
+        MANUAL_MATCH, score 1.0, no runner-up and reason manual_match.
+        Returns the number of rows updated.
+        """
+        a_to_b = self._a_to_b
+        a_names = results_df["A_name"]
+        manual = a_names.isin(a_to_b.keys())
+        b_names = a_names.map({a: b_name for a, (b_name, _) in a_to_b.items()})
+        b_ids = a_names.map({a: b_id for a, (_, b_id) in a_to_b.items()})
+        # where() builds new columns, so string IDs can land in a numeric column
+        results_df["matched_CUP_NAME"] = b_names.where(manual, results_df["matched_CUP_NAME"])
+        results_df["matched_CUP_ID"] = b_ids.where(manual, results_df["matched_CUP_ID"])
+        results_df["decision"] = results_df["decision"].mask(manual, "MANUAL_MATCH")
+        results_df["score"] = results_df["score"].mask(manual, 1.0)
+        results_df["runner_up_score"] = results_df["runner_up_score"].mask(manual, None)
+        results_df["reasons"] = results_df["reasons"].mask(manual, "manual_match")
+        return int(manual.sum())
+
+    def get_a_to_b_map(self) -> Mapping[str, tuple[str, str | None]]:
+        """Get a read-only mapping from A name to (B name, B id) for use in matching.
+
+        The mapping is a live view, maintained as matches are added and removed.
+        """
+        return MappingProxyType(self._a_to_b)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 
 import structlog
 
@@ -10,12 +12,19 @@ from cm.config import MatchConfig
 from cm.embeddings import EmbeddingIndex, EmbeddingProvider
 from cm.index import BlockingIndex
 from cm.llm_arbiter import LLMArbiter, LLMProvider
-from cm.normalize import normalize
+from cm.logging import configure_logging, configured_level, debug_enabled
+from cm.normalize import normalize, normalize_many
 from cm.scoring import score_pair
 from cm.types import MatchResult, NormalizedName, ScoredCandidate
 
 log = structlog.get_logger()
 
+# Below this many A names, process start-up costs more than it saves
+_MIN_PARALLEL_NAMES = 1000
+
+# Per-process matcher, installed once by the pool initializer
+_worker_matcher: Matcher | None = None
+
 
 @dataclass
 class MatcherStats:
@@ -56,7 +65,7 @@ class Matcher:
         """Stage 0: Normalize all B names and build indices."""
         self.stats.b_count = len(names)
         log.info("normalize_b_start", count=len(names))
-        self._b_names = [normalize(n, self.config) for n in names]
+        self._b_names = normalize_many(names, self.config)
         log.info("normalize_b_done")
 
         log.info("build_blocking_index_start")
@@ -69,35 +78,89 @@ class Matcher:
             self.embedding_index.build(core_strings)
             log.info("build_embedding_index_done")
 
+    def reset_b(self) -> None:
+        """Drop the current B names and blocking index.
+
+        Providers, the embedding cache and the LLM cache are kept, so a
+        matcher can be re-used across many small B lists.
+        """
+        self._b_names = []
+        self.index.clear()
+
+    def reset_stats(self) -> None:
+        """Start a fresh statistics and LLM-budget window on a warm matcher.
+
+        Counters restart from zero (b_count is kept, as B is unchanged) and
+        the LLM global call cap applies anew; embedding and LLM caches stay.
+        """
+        self.stats = MatcherStats(b_count=self.stats.b_count)
+        self.embedding_index.api_calls = 0
+        self.embedding_index.cache_hits = 0
+        self.arbiter.reset_call_count()
+
     def match_one(self, a_name: str, a_id: int = 0) -> MatchResult:
         """Match a single A name against the B index."""
-        a = normalize(a_name, self.config)
-        log.debug(
-            "match_one_start",
-            a_id=a_id,
-            a_name=a.original,
-            core_string=a.core_string,
-            acronym=a.acronym,
-        )
+        return self._match_normalized(normalize(a_name, self.config), a_id)
+
+    def _match_normalized(
+        self,
+        a: NormalizedName,
+        a_id: int,
+        neighbors: tuple[list[int], list[float]] | None = None,
+    ) -> MatchResult:
+        """Match an already-normalized A name against the B index.
+
+        neighbors: precomputed embedding query() result for a, if any.
+        """
+        result, llm_candidates = self._score_normalized(a, a_id, neighbors)
+        if llm_candidates:
+            self._arbitrate_pending([(a, result, llm_candidates)])
+        else:
+            self.stats.decisions[result.decision] += 1
+        return result
+
+    def _score_normalized(
+        self,
+        a: NormalizedName,
+        a_id: int,
+        neighbors: tuple[list[int], list[float]] | None = None,
+    ) -> tuple[MatchResult, list[ScoredCandidate] | None]:
+        """Stages 1-3: deterministic result, plus the top-K candidates to
+        offer the LLM when the result is REVIEW and arbitration is enabled.
+
+        Does not count the decision; the caller does once arbitration is done.
+        """
+        # Debug arguments are built per name, so skip them outright when off
+        verbose = debug_enabled()
+        if verbose:
+            log.debug(
+                "match_one_start",
+                a_id=a_id,
+                a_name=a.original,
+                core_string=a.core_string,
+                acronym=a.acronym,
+            )
 
         # Stage 1: Candidate generation
         embedding_candidates: list[int] | None = None
         if self.config.embedding.enabled:
-            b_ids, sims = self.embedding_index.query(a.core_string)
+            b_ids, sims = neighbors or self.embedding_index.query(a.core_string)
             embedding_candidates = b_ids
-            log.debug(
-                "embedding_candidates",
-                count=len(b_ids),
-                top_3=[(bid, round(s, 3)) for bid, s in zip(b_ids[:3], sims[:3])],
-            )
+            if verbose:
+                log.debug(
+                    "embedding_candidates",
+                    count=len(b_ids),
+                    top_3=[(bid, round(s, 3)) for bid, s in zip(b_ids[:3], sims[:3])],
+                )
 
         candidates = self.index.retrieve_candidates(a, embedding_candidates)
-        log.debug("candidates_retrieved", count=len(candidates))
+        if verbose:
+            log.debug("candidates_retrieved", count=len(candidates))
 
         if not candidates:
-            log.debug("no_candidates", a_name=a.original)
+            if verbose:
+                log.debug("no_candidates", a_name=a.original)
             self.stats.no_candidates += 1
-            self.stats.decisions["NO_MATCH"] += 1
             return MatchResult(
                 a_id=a_id,
                 a_name=a.original,
@@ -106,16 +169,25 @@ class Matcher:
                 decision="NO_MATCH",
                 score=0.0,
                 reasons=["no_candidates"],
-            )
+            ), None
 
         # Stage 2: Score all candidates
+        # Embedding cosines for the whole candidate list in one product
+        cosines: list[float] | None = None
+        if self.config.embedding.enabled:
+            cosines = self.embedding_index.similarities(
+                a.core_string, [cand.b_id for cand in candidates]
+            )
+
         scored_candidates: list[ScoredCandidate] = []
-        for cand in candidates:
+        for i, cand in enumerate(candidates):
             b = self._b_names[cand.b_id]
 
             # Get embedding cosine if available
             embedding_cosine: float | None = None
-            if self.config.embedding.enabled:
+            if cosines is not None:
+                embedding_cosine = cosines[i]
+            elif self.config.embedding.enabled:
                 embedding_cosine = self.embedding_index.cosine_similarity(
                     a.core_string, b.core_string
                 )
@@ -134,68 +206,39 @@ class Matcher:
 
         best_b = self._b_names[best.b_id]
 
-        log.debug(
-            "scoring_done",
-            best_b_name=best_b.original,
-            best_score=round(best.score, 4),
-            runner_up_score=round(runner_up_score, 4) if runner_up_score else None,
-            margin=round(margin, 4) if margin else None,
-            reasons=best.reasons,
-        )
+        if verbose:
+            log.debug(
+                "scoring_done",
+                best_b_name=best_b.original,
+                best_score=round(best.score, 4),
+                runner_up_score=round(runner_up_score, 4) if runner_up_score else None,
+                margin=round(margin, 4) if margin else None,
+                reasons=best.reasons,
+            )
 
         # Stage 3: Decision bands
         decision = self._decide(best.score, runner_up_score, margin)
-        log.debug("decision_band", decision=decision)
-
-        used_llm = False
-
-        # Stage 4: Optional LLM arbitration for AMBIGUOUS
-        if decision == "REVIEW" and self.config.llm.enabled:
-            log.debug("llm_arbitration_check", a_name=a.original)
-            # Check top-K candidates for LLM eligibility
-            top_k = scored_candidates[: self.config.llm.top_k]
-            for sc in top_k:
-                b_cand = self._b_names[sc.b_id]
-                sc_runner = top_k[1].score if len(top_k) > 1 else None
-                if self.arbiter.is_eligible(a, b_cand, sc, sc_runner):
-                    log.info(
-                        "llm_arbitration_call",
-                        a_name=a.original,
-                        b_name=b_cand.original,
-                        score=round(sc.score, 4),
-                    )
-                    llm_decision, llm_response = self.arbiter.arbitrate(
-                        a, b_cand, sc, sc_runner,
-                        strip_categories=self.config.normalization.strip_categories,
-                    )
-                    log.info(
-                        "llm_arbitration_result",
-                        llm_decision=llm_response.decision,
-                        confidence=llm_response.confidence,
-                        reason=llm_response.reason,
-                        final_decision=llm_decision,
-                    )
-                    if llm_decision != "REVIEW":
-                        decision = llm_decision
-                        best = sc
-                        best_b = b_cand
-                        used_llm = True
-                        self.stats.llm_overrides += 1
-                        break
-
-        # Track final decision
-        self.stats.decisions[decision] += 1
-
-        log.debug(
-            "match_one_done",
-            a_name=a.original,
-            decision=decision,
-            matched_b=best_b.original if decision == "MATCH" else None,
-            score=round(best.score, 4),
-            used_llm=used_llm,
-        )
+        if verbose:
+            log.debug("decision_band", decision=decision)
+            log.debug(
+                "match_one_done",
+                a_name=a.original,
+                decision=decision,
+                matched_b=best_b.original if decision == "MATCH" else None,
+                score=round(best.score, 4),
+            )
 
-        return MatchResult(
+        # Clean MATCH/NO_MATCH results only carry the candidate count
+        debug: dict = {"candidate_count": len(candidates)}
+        if decision == "REVIEW" or self.config.debug_always:
+            debug["top_candidates"] = [
+                {"b_id": sc.b_id, "score": sc.score, "reasons": sc.reasons}
+                for sc in scored_candidates[:5]
+            ]
+            if a.meta.get("warnings"):
+                debug["warnings"] = a.meta["warnings"]
+
+        result = MatchResult(
             a_id=a_id,
             a_name=a.original,
             b_id=best.b_id if decision == "MATCH" else None,
@@ -204,41 +247,125 @@ class Matcher:
             score=best.score,
             runner_up_score=runner_up_score,
             margin=margin,
-            used_llm=used_llm,
             reasons=best.reasons,
-            debug={
-                "top_candidates": [
-                    {"b_id": sc.b_id, "score": sc.score, "reasons": sc.reasons}
-                    for sc in scored_candidates[:5]
-                ],
-                "warnings": a.meta.get("warnings", []),
-                "candidate_count": len(candidates),
-            },
+            debug=debug,
         )
+        if decision == "REVIEW" and self.config.llm.enabled:
+            return result, scored_candidates[: self.config.llm.top_k]
+        return result, None
+
+    def _arbitrate_pending(
+        self, pending: list[tuple[NormalizedName, MatchResult, list[ScoredCandidate]]]
+    ) -> None:
+        """Run stage 4 for REVIEW results and count their final decisions.
+
+        Different A names are arbitrated concurrently (the LLM call is
+        blocking network I/O); each name's own candidates stay sequential.
+        A repeated A name is arbitrated once and its outcome copied to the
+        other occurrences, so the same pair is never queried concurrently.
+        """
+        first: dict[str, MatchResult] = {}
+        unique: list[tuple[NormalizedName, MatchResult, list[ScoredCandidate]]] = []
+        for item in pending:
+            if item[0].original not in first:
+                first[item[0].original] = item[1]
+                unique.append(item)
+
+        workers = min(self.config.llm.max_concurrency, len(unique))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                overridden = dict(zip(
+                    first, pool.map(lambda item: self._arbitrate(*item), unique)
+                ))
+        else:
+            overridden = {item[0].original: self._arbitrate(*item) for item in unique}
+
+        for a, result, _ in pending:
+            source = first[a.original]
+            if result is not source and overridden[a.original]:
+                result.decision = source.decision
+                result.b_id = source.b_id
+                result.b_name = source.b_name
+                result.score = source.score
+                result.reasons = source.reasons
+                result.used_llm = True
+            self.stats.llm_overrides += overridden[a.original]
+            self.stats.decisions[result.decision] += 1
+
+    def _arbitrate(
+        self, a: NormalizedName, result: MatchResult, top_k: list[ScoredCandidate]
+    ) -> bool:
+        """Stage 4: offer a REVIEW result's top-K candidates to the LLM.
+
+        The first non-REVIEW answer overrides result in place; returns
+        whether that happened.
+        """
+        log.debug("llm_arbitration_check", a_name=a.original)
+        sc_runner = top_k[1].score if len(top_k) > 1 else None
+        for sc in top_k:
+            b_cand = self._b_names[sc.b_id]
+            if not self.arbiter.is_eligible(a, b_cand, sc, sc_runner):
+                continue
+            log.info(
+                "llm_arbitration_call",
+                a_name=a.original,
+                b_name=b_cand.original,
+                score=round(sc.score, 4),
+            )
+            llm_decision, llm_response = self.arbiter.arbitrate(
+                a, b_cand, sc, sc_runner,
+                strip_categories=self.config.normalization.strip_categories,
+            )
+            log.info(
+                "llm_arbitration_result",
+                llm_decision=llm_response.decision,
+                confidence=llm_response.confidence,
+                reason=llm_response.reason,
+                final_decision=llm_decision,
+            )
+            if llm_decision != "REVIEW":
+                matched = llm_decision == "MATCH"
+                result.decision = llm_decision
+                result.b_id = sc.b_id if matched else None
+                result.b_name = b_cand.original if matched else None
+                result.score = sc.score
+                result.reasons = sc.reasons
+                result.used_llm = True
+                return True
+        return False
+
+    def match_all(self, a_names: list[str], workers: int = 1) -> list[MatchResult]:
+        """Match all A names against the B index.
+
+        workers: processes to shard A across (opt-in). Small inputs are
+            always matched in-process.
+        """
+        if workers > 1 and len(a_names) >= _MIN_PARALLEL_NAMES:
+            return self._match_all_parallel(a_names, workers)
 
-    def match_all(self, a_names: list[str]) -> list[MatchResult]:
-        """Match all A names against the B index."""
         self.stats.a_count = len(a_names)
 
-        # Pre-compute embeddings for all A names in one batch
+        # Normalize once; the same forms feed the embedding batch and matching
+        a_normalized = normalize_many(a_names, self.config)
+
+        # Pre-compute embeddings for all A names in one batch, so query()
+        # never falls back to a per-name embed_batch call, then look up all
+        # neighbors with batched similarity products
+        a_neighbors: list[tuple[list[int], list[float]] | None] = [None] * len(a_normalized)
         if self.config.embedding.enabled:
             log.info("precompute_a_embeddings_start", count=len(a_names))
-            a_normalized = [normalize(n, self.config) for n in a_names]
             a_core_strings = [n.core_string for n in a_normalized]
             self.embedding_index.precompute(a_core_strings)
             log.info("precompute_a_embeddings_done")
+            a_neighbors = self.embedding_index.query_batch(a_core_strings)
 
-        results: list[MatchResult] = []
-        for i, name in enumerate(a_names):
-            result = self.match_one(name, a_id=i)
-            results.append(result)
-            if (i + 1) % 1000 == 0:
-                log.info(
-                    "match_progress",
-                    processed=i + 1,
-                    total=len(a_names),
-                    llm_calls=self.arbiter.calls_made,
-                )
+        # Pass 1 scores every name; REVIEW results the LLM may settle are
+        # collected and arbitrated together in pass 2
+        results, pending = self._score_many(a_normalized, neighbors=a_neighbors)
+
+        if pending:
+            log.info("llm_arbitration_start", pending=len(pending))
+            self._arbitrate_pending(pending)
 
         # Collect final stats
         self.stats.llm_calls = self.arbiter.calls_made
@@ -247,6 +374,90 @@ class Matcher:
 
         return results
 
+    def _match_all_parallel(self, a_names: list[str], workers: int) -> list[MatchResult]:
+        """Shard A names across worker processes, each holding a copy of the matcher.
+
+        Workers only score (stages 1-3). REVIEW results that need LLM
+        arbitration come back with their top-K candidates and are arbitrated
+        here, so the global LLM call cap and response cache stay shared.
+        Worker stats are merged back into self.stats.
+        """
+        if self.config.embedding.enabled:
+            # Embed A once up front so every worker inherits a warm cache
+            a_core_strings = [n.core_string for n in normalize_many(a_names, self.config)]
+            self.embedding_index.precompute(a_core_strings)
+
+        chunk_size = -(-len(a_names) // workers)
+        # Spawn, not fork: the parent may already run native thread pools (BLAS, Numba)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self, configured_level()),
+        ) as pool:
+            futures = [
+                pool.submit(_match_chunk, a_names[start : start + chunk_size], start)
+                for start in range(0, len(a_names), chunk_size)
+            ]
+            parts = [future.result() for future in futures]
+
+        stats = self.stats
+        stats.a_count = len(a_names)
+        stats.embedding_api_calls = self.embedding_index.api_calls
+        stats.embedding_cache_hits = self.embedding_index.cache_hits
+        results: list[MatchResult] = []
+        pending: list[tuple[NormalizedName, MatchResult, list[ScoredCandidate]]] = []
+        for part_results, part_pending, part_stats in parts:
+            results.extend(part_results)
+            pending.extend(part_pending)
+            stats.comparisons += part_stats.comparisons
+            stats.no_candidates += part_stats.no_candidates
+            stats.embedding_api_calls += part_stats.embedding_api_calls
+            stats.embedding_cache_hits += part_stats.embedding_cache_hits
+            for decision, count in part_stats.decisions.items():
+                stats.decisions[decision] += count
+
+        self._arbitrate_pending(pending)
+        stats.llm_calls = self.arbiter.calls_made
+        return results
+
+    def _score_many(
+        self,
+        a_normalized: list[NormalizedName],
+        offset: int = 0,
+        neighbors: list[tuple[list[int], list[float]] | None] | None = None,
+    ) -> tuple[
+        list[MatchResult], list[tuple[NormalizedName, MatchResult, list[ScoredCandidate]]]
+    ]:
+        """Score a batch of A names (stages 1-3), in order.
+
+        Returns the results and the REVIEW results awaiting LLM arbitration;
+        decisions are counted for the rest. A repeated A name reuses the
+        first occurrence's candidates and scores under its own a_id.
+        """
+        results: list[MatchResult] = []
+        pending: list[tuple[NormalizedName, MatchResult, list[ScoredCandidate]]] = []
+        scored: dict[str, tuple[MatchResult, list[ScoredCandidate] | None]] = {}
+        for i, a in enumerate(a_normalized):
+            first = scored.get(a.original)
+            if first is None:
+                result, llm_candidates = scored[a.original] = self._score_normalized(
+                    a, a_id=offset + i, neighbors=neighbors[i] if neighbors else None
+                )
+            else:
+                # Copied before arbitration, which overrides fields in place
+                result, llm_candidates = replace(first[0], a_id=offset + i), first[1]
+                if result.reasons == ["no_candidates"]:
+                    self.stats.no_candidates += 1
+            if llm_candidates:
+                pending.append((a, result, llm_candidates))
+            else:
+                self.stats.decisions[result.decision] += 1
+            results.append(result)
+            if (i + 1) % 1000 == 0:
+                log.info("match_progress", processed=i + 1, total=len(a_normalized))
+        return results, pending
+
     def _decide(
         self, best_score: float, runner_up_score: float | None, margin: float | None
     ) -> str:
@@ -261,3 +472,36 @@ class Matcher:
                 return "MATCH"
 
         return "REVIEW"
+
+
+def _init_worker(matcher: Matcher, log_level: str | None) -> None:
+    # Spawned workers start unconfigured: structlog would print every
+    # level, debug included, straight to stdout
+    if log_level is not None:
+        configure_logging(log_level)
+    global _worker_matcher
+    _worker_matcher = matcher
+
+
+def _match_chunk(
+    a_names: list[str], offset: int
+) -> tuple[
+    list[MatchResult],
+    list[tuple[NormalizedName, MatchResult, list[ScoredCandidate]]],
+    MatcherStats,
+]:
+    """Score one shard in a worker.
+
+    Returns its results, the REVIEW results still awaiting LLM arbitration
+    (uncounted in the stats), and the stats it added.
+    """
+    matcher = _worker_matcher
+    matcher.stats = MatcherStats()
+    api_calls = matcher.embedding_index.api_calls
+    cache_hits = matcher.embedding_index.cache_hits
+
+    results, pending = matcher._score_many(normalize_many(a_names, matcher.config), offset)
+
+    matcher.stats.embedding_api_calls = matcher.embedding_index.api_calls - api_calls
+    matcher.stats.embedding_cache_hits = matcher.embedding_index.cache_hits - cache_hits
+    return results, pending, matcher.stats
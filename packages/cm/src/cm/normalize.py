@@ -5,16 +5,24 @@ from __future__ import annotations
 import json
 import os
 import re
+import sys
 import unicodedata
 from pathlib import Path
 
 from cm.acronyms import generate_acronym, is_collision, normalize_acronym_input
 from cm.config import MatchConfig
-from cm.designators import canonicalize_token, strip_designators, strip_word_categories
+from cm.designators import ALIASES, strip_designators, strip_word_categories
 from cm.types import NormalizedName
 
 DATA_DIR = Path(os.environ.get("CM_CONFIG_DATA") or "config_data")
 
+_RE_PUNCT = re.compile(r"[^\w]")
+# Deletes the ASCII characters _RE_PUNCT matches, for ASCII tokens
+_ASCII_PUNCT_TABLE = dict.fromkeys(
+    c for c in range(128) if not chr(c).isalnum() and chr(c) != "_"
+)
+_RE_DIGITS = re.compile(r"\d+")
+
 
 def _load_replacements() -> dict[str, str]:
     """Load symbol/string replacements from replacements.json."""
@@ -26,6 +34,11 @@ def _load_replacements() -> dict[str, str]:
 
 REPLACEMENTS: dict[str, str] = _load_replacements()
 
+# Frozen for the hot loop. str.replace with an `in` guard beats both
+# str.translate (multi-char values force its slow dict path) and a compiled
+# alternation regex for these short symbol tables.
+_REPLACEMENT_ITEMS: tuple[tuple[str, str], ...] = tuple(REPLACEMENTS.items())
+
 
 def normalize(name: str, config: MatchConfig | None = None) -> NormalizedName:
     """Normalize a company name into a stable NormalizedName representation."""
@@ -35,35 +48,46 @@ def normalize(name: str, config: MatchConfig | None = None) -> NormalizedName:
     original = name
     warnings: list[str] = []
 
-    # 1. Unicode normalize (NFKC)
-    s = unicodedata.normalize("NFKC", name)
-
-    # 2. Casefold
-    s = s.casefold()
+    # 1-2. Unicode normalize (NFKC) and casefold. NFKC is the identity on
+    # ASCII and casefold() equals lower() there, so most names skip both.
+    if name.isascii():
+        s = name.lower()
+    else:
+        s = unicodedata.normalize("NFKC", name).casefold()
 
     # Store normalized_text before further processing
     normalized_text = s
 
     # 3. Symbol/string replacements (from replacements.json)
-    for old, new in REPLACEMENTS.items():
-        s = s.replace(old, new)
+    for old, new in _REPLACEMENT_ITEMS:
+        if old in s:
+            s = s.replace(old, new)
 
     # 4. Tokenize by whitespace first (before punctuation removal)
     raw_split = s.split()
 
     # 5. Apply alias canonicalization before punctuation removal
     #    This handles "inc.", "l.l.c.", etc. correctly
+    #    (inlined canonicalize_token: one dict probe per token, no call)
+    aliases = ALIASES
     tokens: list[str] = []
     for t in raw_split:
-        canonical = canonicalize_token(t)
+        canonical = aliases.get(t, t)
         if canonical != t:
             # Alias matched (e.g. "inc." -> "inc")
-            tokens.append(canonical)
+            tokens.append(sys.intern(canonical))
         else:
             # Strip punctuation from token, preserve alphanumerics
-            cleaned = re.sub(r"[^\w]", "", t)
+            # (most tokens have none; ASCII ones take the translate table,
+            # about twice as fast as the regex)
+            if t.isalnum():
+                cleaned = t
+            elif t.isascii():
+                cleaned = t.translate(_ASCII_PUNCT_TABLE)
+            else:
+                cleaned = _RE_PUNCT.sub("", t)
             if cleaned:
-                tokens.append(cleaned)
+                tokens.append(sys.intern(cleaned))
     # No additional canonicalization needed
 
     # 7. Save raw_tokens
@@ -78,12 +102,7 @@ def normalize(name: str, config: MatchConfig | None = None) -> NormalizedName:
     )
 
     # 9. Safety rule: if stripping left fewer than 2 tokens, it was reverted
-    if not removed_designators and any(
-        canonicalize_token(t) != t or t in _get_designator_set()
-        for t in tokens
-    ):
-        # strip_designators already handles the revert internally
-        pass
+    # (strip_designators already handles the revert internally)
     if len(core_tokens) < 2 and removed_designators:
         # This shouldn't happen as strip_designators handles it, but safety check
         core_tokens = list(tokens)
@@ -168,15 +187,36 @@ def normalize(name: str, config: MatchConfig | None = None) -> NormalizedName:
     )
 
 
+def normalize_many(
+    names: list[str], config: MatchConfig | None = None
+) -> list[NormalizedName]:
+    """Normalize a batch of names, computing each distinct string only once.
+
+    Repeated inputs share the same NormalizedName instance, so callers must
+    treat the results as read-only.
+    """
+    if config is None:
+        config = MatchConfig()
+
+    seen: dict[str, NormalizedName] = {}
+    results: list[NormalizedName] = []
+    for name in names:
+        normalized = seen.get(name)
+        if normalized is None:
+            normalized = seen[name] = normalize(name, config)
+        results.append(normalized)
+    return results
+
+
 def _extract_numeric_tokens(tokens: list[str]) -> list[str]:
     """Extract numeric content from tokens."""
     numerics: list[str] = []
     for token in tokens:
         if token.isdigit():
             numerics.append(token)
-        else:
+        elif not token.isalpha():
             # Extract numeric substrings
-            nums = re.findall(r"\d+", token)
+            nums = _RE_DIGITS.findall(token)
             numerics.extend(nums)
     return numerics
 
@@ -202,8 +242,3 @@ def _generate_blocking_keys(
         keys["k_first"] = core_tokens[0]
 
     return keys
-
-
-def _get_designator_set() -> set[str]:
-    from cm.designators import DESIGNATORS
-    return DESIGNATORS
@@ -6,20 +6,27 @@ from rapidfuzz import fuzz
 
 from cm.acronyms import acronym_relation
 from cm.config import MatchConfig
-from cm.designators import is_designator
+from cm.designators import DESIGNATORS
 from cm.types import NormalizedName, ScoredCandidate
 
 
-def _effective_core(name: NormalizedName) -> tuple[list[str], str]:
-    """Get effective core tokens, stripping designators for scoring comparison.
+def _effective_core(name: NormalizedName) -> tuple[str, frozenset[str]]:
+    """Get effective core string and token set, stripping designators for scoring.
 
     This handles the case where the safety rule kept designators in core_tokens.
+    Computed once per name and memoized on it, since a B name is scored
+    against many A names.
     """
-    effective = [t for t in name.core_tokens if not is_designator(t)]
-    if len(effective) == 0:
-        # All tokens are designators, use original
-        return name.core_tokens, name.core_string
-    return effective, " ".join(effective)
+    effective_core = name.effective_core
+    if effective_core is None:
+        effective = [t for t in name.core_tokens if t not in DESIGNATORS]
+        if len(effective) == 0:
+            # All tokens are designators, use original
+            effective_core = (name.core_string, frozenset(name.core_tokens))
+        else:
+            effective_core = (" ".join(effective), frozenset(effective))
+        name.effective_core = effective_core
+    return effective_core
 
 
 def score_pair(
@@ -35,12 +42,10 @@ def score_pair(
     penalties = config.penalties
 
     # Use effective core (designators stripped for comparison)
-    a_eff_tokens, a_eff_string = _effective_core(a)
-    b_eff_tokens, b_eff_string = _effective_core(b)
+    a_eff_string, a_set = _effective_core(a)
+    b_eff_string, b_set = _effective_core(b)
 
     # 1. Token overlap coefficient: |A∩B| / min(|A|, |B|)
-    a_set = set(a_eff_tokens)
-    b_set = set(b_eff_tokens)
     min_len = min(len(a_set), len(b_set))
     if min_len > 0:
         overlap = len(a_set & b_set) / min_len
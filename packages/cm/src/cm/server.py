@@ -11,6 +11,7 @@ from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
+from cm.io import read_excel, write_excel
 from cm.manual_matches import ManualMatchStore
 
 log = structlog.get_logger()
@@ -63,24 +64,32 @@ def create_app(
     cup_path: str,
     matches_path: str,
     results_path: str | None = None,
+    excel_cache_dir: str | None = None,
 ) -> FastAPI:
-    """Create the FastAPI application."""
+    """Create the FastAPI application.
+
+    excel_cache_dir: where parsed workbooks are cached between starts (see
+        cm.io.read_excel); None always parses the files.
+    """
     app = FastAPI(title="CM Grep UI")
 
     # Load data at startup
     log.info("server_loading_data", top=top_path, cup=cup_path)
-    top_df = pd.read_excel(top_path)
-    cup_df = pd.read_excel(cup_path)
+    top_df = read_excel(top_path, cache_dir=excel_cache_dir)
+    cup_df = read_excel(cup_path, cache_dir=excel_cache_dir)
 
     # Extract names
     a_names_list: list[str] = top_df["A"].dropna().tolist()
-    b_entries: list[dict[str, Any]] = []
-    for idx, row in cup_df.iterrows():
-        if pd.notna(row["CUP_NAME"]):
-            b_entries.append({
-                "name": row["CUP_NAME"],
-                "id": str(row["CUP_ID"]) if pd.notna(row.get("CUP_ID")) else None,
-            })
+    named = cup_df[cup_df["CUP_NAME"].notna()]
+    cup_ids = named["CUP_ID"].tolist() if "CUP_ID" in named else [None] * len(named)
+    b_entries: list[dict[str, Any]] = [
+        {"name": name, "id": str(cup_id) if pd.notna(cup_id) else None}
+        for name, cup_id in zip(named["CUP_NAME"].tolist(), cup_ids)
+    ]
+
+    # Lowercased once for the substring search endpoints
+    a_names_lower = [str(n).lower() for n in a_names_list]
+    b_names_lower = [str(e["name"]).lower() for e in b_entries]
 
     log.info("server_data_loaded", a_count=len(a_names_list), b_count=len(b_entries))
 
@@ -94,45 +103,35 @@ def create_app(
     review_a_names: set[str] = set()  # A names that need review (no matched CUP)
     if results_path and Path(results_path).exists():
         log.info("loading_auto_matches", path=results_path)
-        results_df = pd.read_excel(results_path)
-        # Group by matched_CUP_NAME for MATCH and REVIEW decisions
-        for _, row in results_df.iterrows():
-            decision = row.get("decision")
-            a_name = str(row["A_name"])
-
-            if decision == "REVIEW":
-                if pd.notna(row.get("matched_CUP_NAME")):
-                    # Review with a suggested match
-                    b_name = str(row["matched_CUP_NAME"])
-                    b_id = str(row["matched_CUP_ID"]) if pd.notna(row.get("matched_CUP_ID")) else None
-                    score = float(row["score"]) if pd.notna(row.get("score")) else 0.0
-                    if b_name not in review_matches:
-                        review_matches[b_name] = AutoMatchResponse(
-                            b_name=b_name,
-                            b_id=b_id,
-                            a_names=[],
-                            decision=decision,
-                            score=score,
-                        )
-                    if a_name not in review_matches[b_name].a_names:
-                        review_matches[b_name].a_names.append(a_name)
-                else:
+        results_df = read_excel(results_path, cache_dir=excel_cache_dir)
+        # Group by matched_CUP_NAME for MATCH and REVIEW decisions; plain
+        # tuples per row (reindex fills any missing column with NaN)
+        rows = results_df.reindex(
+            columns=["A_name", "decision", "matched_CUP_NAME", "matched_CUP_ID", "score"]
+        ).itertuples(index=False, name=None)
+        grouped: set[tuple[str, str, str]] = set()  # (decision, b_name, a_name)
+        for a_name, decision, b_name, b_id, score in rows:
+            a_name = str(a_name)
+            if decision not in ("MATCH", "REVIEW"):
+                continue
+            if pd.isna(b_name):
+                if decision == "REVIEW":
                     # Review without a suggested match - track A name
                     review_a_names.add(a_name)
-            elif decision == "MATCH" and pd.notna(row.get("matched_CUP_NAME")):
-                b_name = str(row["matched_CUP_NAME"])
-                b_id = str(row["matched_CUP_ID"]) if pd.notna(row.get("matched_CUP_ID")) else None
-                score = float(row["score"]) if pd.notna(row.get("score")) else 0.0
-                if b_name not in auto_matches:
-                    auto_matches[b_name] = AutoMatchResponse(
-                        b_name=b_name,
-                        b_id=b_id,
-                        a_names=[],
-                        decision=decision,
-                        score=score,
-                    )
-                if a_name not in auto_matches[b_name].a_names:
-                    auto_matches[b_name].a_names.append(a_name)
+                continue
+            b_name = str(b_name)
+            groups = auto_matches if decision == "MATCH" else review_matches
+            if b_name not in groups:
+                groups[b_name] = AutoMatchResponse(
+                    b_name=b_name,
+                    b_id=str(b_id) if pd.notna(b_id) else None,
+                    a_names=[],
+                    decision=decision,
+                    score=float(score) if pd.notna(score) else 0.0,
+                )
+            if (decision, b_name, a_name) not in grouped:
+                grouped.add((decision, b_name, a_name))
+                groups[b_name].a_names.append(a_name)
         log.info("auto_matches_loaded", count=len(auto_matches), review_count=len(review_matches), review_a_names=len(review_a_names))
 
     # Build sets for quick lookup of which B names have matches
@@ -146,7 +145,7 @@ def create_app(
         if not q:
             return a_names_list
         q_lower = q.lower()
-        return [n for n in a_names_list if q_lower in n.lower()]
+        return [n for n, n_lower in zip(a_names_list, a_names_lower) if q_lower in n_lower]
 
     @app.get("/api/names/b")
     async def get_b_names(q: str = "", filter: str = "") -> list[NameEntry]:
@@ -171,7 +170,10 @@ def create_app(
         # Build list with optional query filter
         if q:
             q_lower = q.lower()
-            entries = [make_entry(e) for e in b_entries if q_lower in e["name"].lower()]
+            entries = [
+                make_entry(e) for e, name_lower in zip(b_entries, b_names_lower)
+                if q_lower in name_lower
+            ]
         else:
             entries = [make_entry(e) for e in b_entries]
 
@@ -267,65 +269,36 @@ def create_app(
         if not results_path or not Path(results_path).exists():
             raise HTTPException(status_code=400, detail="No results file available")
 
-        # Load automatic matching results
-        results_df = pd.read_excel(results_path)
-
-        # Build a mapping from A name to manual match info
-        manual_matches = store.get_all()
-        a_to_manual: dict[str, tuple[str, str | None]] = {}
-        for match in manual_matches:
-            for a_name in match.a_names:
-                a_to_manual[a_name] = (match.b_name, match.b_id)
-
-        # Apply manual matches to results
-        updated_count = 0
-        for idx, row in results_df.iterrows():
-            a_name = row["A_name"]
-            if a_name in a_to_manual:
-                b_name, b_id = a_to_manual[a_name]
-                results_df.at[idx, "matched_CUP_NAME"] = b_name
-                results_df.at[idx, "matched_CUP_ID"] = b_id
-                results_df.at[idx, "decision"] = "MANUAL_MATCH"
-                results_df.at[idx, "score"] = 1.0
-                results_df.at[idx, "runner_up_score"] = None
-                results_df.at[idx, "reasons"] = "manual_match"
-                updated_count += 1
+        # Load automatic matching results (cached by the startup read
+        # unless the file has changed since)
+        results_df = read_excel(results_path, cache_dir=excel_cache_dir)
+
+        updated_count = store.apply_to_results(results_df)
 
         # Save finalized results
         output_path = Path(results_path).parent / "finalized_matching_results.xlsx"
-        results_df.to_excel(output_path, index=False)
-
-        # Build mapping from finalized results: A_name -> (matched_CUP_NAME, matched_CUP_ID)
-        a_to_cup: dict[str, tuple[str | None, str | None]] = {}
-        cup_to_a: dict[str, list[str]] = {}
-        for _, row in results_df.iterrows():
-            a_name = row["A_name"]
-            cup_name = row.get("matched_CUP_NAME")
-            cup_id = row.get("matched_CUP_ID")
-            if pd.notna(cup_name):
-                a_to_cup[a_name] = (str(cup_name), str(cup_id) if pd.notna(cup_id) else None)
-                if cup_name not in cup_to_a:
-                    cup_to_a[cup_name] = []
-                cup_to_a[cup_name].append(a_name)
+        write_excel(results_df, output_path)
+
+        # Finalized mappings: A name -> CUP name/ID (last row wins) and
+        # CUP name -> its A names in row order
+        matched = results_df[results_df["matched_CUP_NAME"].notna()]
+        cup_ids = matched["matched_CUP_ID"]
+        a_to_cup_name = dict(zip(matched["A_name"], matched["matched_CUP_NAME"].astype(str)))
+        a_to_cup_id = dict(zip(matched["A_name"], cup_ids.astype(str).where(cup_ids.notna(), None)))
+        cup_to_a = matched.groupby("matched_CUP_NAME", sort=False)["A_name"].agg("; ".join)
 
         # Generate top_2000_unmapped_matched.xlsx
         top_matched_df = top_df.copy()
-        top_matched_df["matched_CUP_NAME"] = top_matched_df["A"].apply(
-            lambda x: a_to_cup.get(x, (None, None))[0]
-        )
-        top_matched_df["matched_CUP_ID"] = top_matched_df["A"].apply(
-            lambda x: a_to_cup.get(x, (None, None))[1]
-        )
+        top_matched_df["matched_CUP_NAME"] = top_matched_df["A"].map(a_to_cup_name)
+        top_matched_df["matched_CUP_ID"] = top_matched_df["A"].map(a_to_cup_id)
         top_matched_path = Path(results_path).parent / "top_2000_unmapped_matched.xlsx"
-        top_matched_df.to_excel(top_matched_path, index=False)
+        write_excel(top_matched_df, top_matched_path)
 
         # Generate CUP_raw_data_matched.xlsx
         cup_matched_df = cup_df.copy()
-        cup_matched_df["matched_A_names"] = cup_matched_df["CUP_NAME"].apply(
-            lambda x: "; ".join(cup_to_a.get(x, [])) if pd.notna(x) else ""
-        )
+        cup_matched_df["matched_A_names"] = cup_matched_df["CUP_NAME"].map(cup_to_a).fillna("")
         cup_matched_path = Path(results_path).parent / "CUP_raw_data_matched.xlsx"
-        cup_matched_df.to_excel(cup_matched_path, index=False)
+        write_excel(cup_matched_df, cup_matched_path)
 
         log.info(
             "finalize_complete",
@@ -21,6 +21,11 @@ class NormalizedName:
         "warnings": [],
         "notes": {},
     })
+    # (string, token set) of core_tokens minus designators, filled in by
+    # cm.scoring on first use; derived data, so excluded from comparisons
+    effective_core: tuple[str, frozenset[str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
 
 @dataclass
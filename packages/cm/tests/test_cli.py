@@ -0,0 +1,80 @@
+"""Tests for the command-line entry points."""
+
+import argparse
+import io
+import json
+from dataclasses import replace
+
+import pandas as pd
+
+from cm.config import EmbeddingConfig, MatchConfig
+from cm.matcher import Matcher
+
+CUP = [
+    "First National Bank of Boston",
+    "First National Bank of Chicago",
+    "Second Street Savings of Ohio",
+    "Second Street Savings of Iowa",
+]
+
+
+class LocalProvider:
+    def __init__(self):
+        self.calls: list[str] = []
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        return [[float(len(t)), 1.0, 0.5, 0.25] for t in texts]
+
+    def query(self, prompt: str) -> str:
+        self.calls.append(prompt)
+        return '{"decision": "SAME", "confidence": 0.9, "reason": "test"}'
+
+
+def _matcher(tmp_path, provider: LocalProvider) -> Matcher:
+    config = MatchConfig(embedding=EmbeddingConfig(enabled=True, cache_dir=str(tmp_path)))
+    config.llm.enabled = True
+    config.llm.global_call_cap = 1
+    matcher = Matcher(config, llm_provider=provider, embedding_provider=provider)
+    matcher.preprocess_b(CUP)
+    return matcher
+
+
+def test_serve_jobs_start_from_fresh_stats(tmp_path, monkeypatch, capfd):
+    from cm import cli
+
+    cup_path = tmp_path / "cup.xlsx"
+    pd.DataFrame({"CUP_NAME": CUP, "CUP_ID": range(len(CUP))}).to_excel(cup_path, index=False)
+    for name, a in (("first", "First National Bank"), ("second", "Second Street Savings")):
+        pd.DataFrame({"A": [a, "Unknown Corp"]}).to_excel(tmp_path / f"{name}.xlsx", index=False)
+
+    served = LocalProvider()
+    matcher = _matcher(tmp_path, served)
+    capfd.readouterr()
+    monkeypatch.setattr(cli, "_build_matcher", lambda args: matcher)
+    monkeypatch.setattr(cli, "_EXCEL_CACHE_DIR", str(tmp_path / "xlsx"))
+    monkeypatch.setattr("cm.matcher._MIN_PARALLEL_NAMES", 0)
+    jobs = [
+        {"top": str(tmp_path / f"{name}.xlsx"), "output": str(tmp_path / f"{name}_out.xlsx")}
+        for name in ("first", "second")
+    ]
+    monkeypatch.setattr("sys.stdin", io.StringIO("".join(json.dumps(job) + "\n" for job in jobs)))
+    args = argparse.Namespace(cup=str(cup_path), top=None, output=None, matches=None, jobs=2)
+
+    cli.cmd_serve(args)
+
+    # Only status lines reach stdout, even with worker processes
+    out = capfd.readouterr().out
+    assert [json.loads(line)["ok"] for line in out.splitlines()] == [True, True]
+
+    # The second job is reported and budgeted exactly as a fresh run of it
+    fresh_provider = LocalProvider()
+    fresh = _matcher(tmp_path, fresh_provider)
+    expected = fresh.match_all(["Second Street Savings", "Unknown Corp"])[0]
+    assert matcher.stats.llm_calls == fresh.stats.llm_calls == 1
+    assert len(served.calls) == 2
+    # Embedding counters differ by design: B was embedded once, at startup
+    ignore = {"embedding_api_calls": 0, "embedding_cache_hits": 0}
+    assert replace(matcher.stats, **ignore) == replace(fresh.stats, **ignore)
+    second = pd.read_excel(tmp_path / "second_out.xlsx")
+    assert expected.used_llm
+    assert second["matched_CUP_NAME"].iloc[0] == expected.b_name
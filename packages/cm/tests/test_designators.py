@@ -51,6 +51,13 @@ def test_strip_multiple_suffix():
     assert "corp" in removed
 
 
+def test_strip_multi_token_designator():
+    tokens = ["tata", "consultancy", "private", "limited"]
+    core, removed = strip_designators(tokens)
+    assert core == ["tata", "consultancy"]
+    assert removed == ["private", "limited"]
+
+
 def test_strip_safety_short_core():
     # If stripping leaves < 2 tokens, revert
     tokens = ["inc", "corp"]
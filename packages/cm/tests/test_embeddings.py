@@ -23,8 +23,8 @@ class MockEmbeddingProvider:
         embeddings = []
         for text in texts:
             # Create a simple deterministic embedding based on text
-            np.random.seed(hash(text) % (2**32))
-            embedding = np.random.randn(self.embedding_dim).tolist()
+            rng = np.random.default_rng(hash(text) % (2**32))
+            embedding = rng.standard_normal(self.embedding_dim).tolist()
             embeddings.append(embedding)
         return embeddings
 
@@ -73,11 +73,40 @@ class TestEmbeddingIndexCaching:
 
         index.build(["Apple Inc", "Microsoft Corp"])
 
-        cache_file = tmp_path / "embedding_cache.json"
-        assert cache_file.exists()
-        cache = json.loads(cache_file.read_text())
-        assert "Apple Inc" in cache
-        assert "Microsoft Corp" in cache
+        matrix = np.fromfile(tmp_path / "embedding_cache.f32", dtype=np.float32)
+        keys_file = tmp_path / "embedding_cache_keys.jsonl"
+        header, *keys = [json.loads(line) for line in keys_file.read_text().splitlines()]
+        assert header == {"dim": 4}
+        assert keys == ["Apple Inc", "Microsoft Corp"]
+        assert matrix.shape == (8,)
+
+    def test_cache_save_appends_only_new_rows(self, tmp_path: Path):
+        config = EmbeddingConfig(enabled=True, cache_dir=str(tmp_path))
+        provider = MockEmbeddingProvider()
+        index = EmbeddingIndex(config, provider=provider)
+        index.build(["Apple Inc", "Microsoft Corp"])
+        index.precompute(["Google LLC"])
+
+        keys_file = tmp_path / "embedding_cache_keys.jsonl"
+        lines = keys_file.read_text().splitlines()
+        assert [json.loads(line) for line in lines[1:]] == [
+            "Apple Inc", "Microsoft Corp", "Google LLC",
+        ]
+        assert (tmp_path / "embedding_cache.f32").stat().st_size == 3 * 4 * 4
+
+    def test_cache_round_trip(self, tmp_path: Path):
+        config = EmbeddingConfig(enabled=True, cache_dir=str(tmp_path))
+        provider = MockEmbeddingProvider()
+        EmbeddingIndex(config, provider=provider).build(["Apple Inc", "Microsoft Corp"])
+
+        provider = MockEmbeddingProvider()
+        index = EmbeddingIndex(config, provider=provider)
+        index.build(["Apple Inc", "Microsoft Corp", "Google LLC"])
+
+        # Only the new name is embedded; the rest come from the memmapped cache
+        assert provider.calls == [["Google LLC"]]
+        assert index.cache_hits == 2
+        assert index._embeddings.shape == (3, 4)
 
     def test_cache_loads_on_build(self, tmp_path: Path):
         # Pre-populate cache
@@ -109,6 +138,43 @@ class TestEmbeddingIndexCaching:
         assert index.cache_hits == 1
 
 
+    def test_duplicate_inputs_share_one_cache_row(self, tmp_path: Path):
+        config = EmbeddingConfig(enabled=True, cache_dir=str(tmp_path))
+        provider = MockEmbeddingProvider()
+        index = EmbeddingIndex(config, provider=provider)
+        index.build(["apple", "apple", "microsoft"])
+
+        assert provider.calls == [["apple", "microsoft"]]
+        assert index._cache_rows == 2
+
+        reloaded = EmbeddingIndex(config, provider=MockEmbeddingProvider())
+        reloaded._load_cache()
+        for key in ["apple", "microsoft"]:
+            np.testing.assert_array_equal(
+                reloaded._cache_matrix[reloaded._cache[key]],
+                index._cache_matrix[index._cache[key]],
+            )
+
+
+    def test_cache_ignores_orphaned_rows_from_interrupted_save(self, tmp_path: Path):
+        config = EmbeddingConfig(enabled=True, cache_dir=str(tmp_path))
+        EmbeddingIndex(config, provider=MockEmbeddingProvider()).build(["apple"])
+        # Simulate a save that wrote a row but crashed before writing its key
+        with (tmp_path / "embedding_cache.f32").open("ab") as f:
+            f.write(np.zeros(4, dtype=np.float32).tobytes())
+
+        index = EmbeddingIndex(config, provider=MockEmbeddingProvider())
+        index.build(["apple", "google"])
+
+        reloaded = EmbeddingIndex(config, provider=MockEmbeddingProvider())
+        reloaded._load_cache()
+        np.testing.assert_array_equal(
+            reloaded._cache_matrix[reloaded._cache["google"]],
+            index._cache_matrix[index._cache["google"]],
+        )
+        assert reloaded._cache_matrix[reloaded._cache["google"]].any()
+
+
 class TestEmbeddingIndexQuery:
     """Tests for querying the embedding index."""
 
@@ -147,6 +213,114 @@ class TestEmbeddingIndexQuery:
         # Should be sorted by similarity (descending)
         assert similarities[0] >= similarities[1]
 
+    def test_query_uses_hnsw_above_min_size(self, tmp_path: Path):
+        pytest.importorskip("hnswlib")
+        config = EmbeddingConfig(
+            enabled=True, cache_dir=str(tmp_path), ann_neighbors=2, hnsw_min_size=0
+        )
+        provider = MockEmbeddingProvider()
+        index = EmbeddingIndex(config, provider=provider)
+        index.build(["Apple Inc", "Microsoft Corp", "Google LLC", "Meta Inc"])
+        index.precompute(["Apple Inc"])
+
+        indices, similarities = index.query("Apple Inc")
+
+        assert index._hnsw is not None
+        assert indices[0] == 0
+        assert similarities[0] == pytest.approx(1.0, abs=1e-4)
+        assert similarities[0] >= similarities[1]
+
+    def test_query_binary_quantization(self, tmp_path: Path):
+        config = EmbeddingConfig(
+            enabled=True, cache_dir=str(tmp_path), ann_neighbors=2, quantization="binary"
+        )
+        provider = MockEmbeddingProvider(embedding_dim=16)
+        index = EmbeddingIndex(config, provider=provider)
+        index.build(["Apple Inc", "Microsoft Corp", "Google LLC", "Meta Inc"])
+        index.precompute(["Apple Inc"])
+
+        indices, similarities = index.query("Apple Inc")
+
+        assert index._packed is not None
+        assert index._packed.shape == (4, 2)
+        assert indices[0] == 0
+        assert similarities[0] == pytest.approx(1.0, abs=1e-5)
+        assert similarities[0] >= similarities[1]
+
+    def test_query_numba_kernel_matches_numpy(self, tmp_path: Path):
+        pytest.importorskip("numba")
+        from cm.embeddings import _topk_cosine
+
+        rng = np.random.default_rng(0)
+        embeddings = rng.standard_normal((50, 8)).astype(np.float32)
+        query = embeddings[7].copy()
+
+        indices, sims = _topk_cosine(embeddings, query, 5, 3)
+
+        expected = np.argsort(embeddings @ query)[::-1][:5]
+        assert indices.tolist() == expected.tolist()
+        np.testing.assert_allclose(sims, (embeddings @ query)[expected], rtol=1e-5)
+
+    def test_query_small_catalog_skips_numba(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        def fail(*args):
+            raise AssertionError("Numba kernel used below jit_min_size")
+
+        monkeypatch.setattr("cm.embeddings._topk_cosine", fail, raising=False)
+        config = EmbeddingConfig(enabled=True, cache_dir=str(tmp_path), ann_neighbors=2)
+        index = EmbeddingIndex(config, provider=MockEmbeddingProvider())
+        index.build(["Apple Inc", "Microsoft Corp", "Google LLC"])
+        index.precompute(["Apple Inc"])
+
+        indices, _ = index.query("Apple Inc")
+
+        assert indices[0] == 0
+
+    def test_query_batch_matches_query(self, tmp_path: Path):
+        config = EmbeddingConfig(enabled=True, cache_dir=str(tmp_path), ann_neighbors=2)
+        index = EmbeddingIndex(config, provider=MockEmbeddingProvider())
+        index.build(["Apple Inc", "Microsoft Corp", "Google LLC", "Meta Inc"])
+        queries = ["Google LLC", "Apple Inc", "Test Query"]
+        index.precompute(queries)
+
+        batched = index.query_batch(queries)
+
+        for (b_ids, b_sims), query in zip(batched, queries):
+            ids, sims = index.query(query)
+            assert b_ids == ids
+            np.testing.assert_allclose(b_sims, sims, rtol=1e-5, atol=1e-6)
+
+    def test_query_k_covering_catalog_returns_all_sorted(self, tmp_path: Path):
+        config = EmbeddingConfig(enabled=True, cache_dir=str(tmp_path), ann_neighbors=10)
+        index = EmbeddingIndex(config, provider=MockEmbeddingProvider())
+        index.build(["Apple Inc", "Microsoft Corp", "Google LLC"])
+        index.precompute(["Apple Inc"])
+
+        indices, similarities = index.query("Apple Inc")
+
+        assert sorted(indices) == [0, 1, 2]
+        assert indices[0] == 0
+        assert similarities == sorted(similarities, reverse=True)
+        assert index.query_batch(["Apple Inc"])[0][0] == indices
+
+    def test_shared_core_strings_indexed_once(self, tmp_path: Path):
+        config = EmbeddingConfig(enabled=True, cache_dir=str(tmp_path), ann_neighbors=3)
+        index = EmbeddingIndex(config, provider=MockEmbeddingProvider())
+        index.build(["acme", "globex", "acme", "initech"])
+        index.precompute(["acme"])
+
+        assert index._embeddings.shape == (3, 4)
+        ids, sims = index.query("acme")
+        assert sorted(ids[:2]) == [0, 2]
+        assert len(ids) == 3
+        np.testing.assert_allclose(sims[:2], [1.0, 1.0], rtol=1e-5)
+        assert index.query_batch(["acme"])[0][0] == ids
+        np.testing.assert_allclose(
+            index.similarities("acme", [3, 2, 0]),
+            [index.cosine_similarity("acme", b) for b in ("initech", "acme", "acme")],
+            rtol=1e-5,
+            atol=1e-6,
+        )
+
     def test_query_from_cache(self, tmp_path: Path):
         config = EmbeddingConfig(enabled=True, cache_dir=str(tmp_path), ann_neighbors=2)
         provider = MockEmbeddingProvider()
@@ -182,6 +356,23 @@ class TestEmbeddingIndexPrecompute:
         assert "Apple Inc" in index._cache
         assert "Microsoft Corp" in index._cache
 
+    def test_precompute_concurrent_batches_match_serial(self, tmp_path: Path):
+        names = [f"Company {i}" for i in range(10)]
+        results = []
+        for concurrency in (1, 4):
+            config = EmbeddingConfig(
+                enabled=True,
+                cache_dir=str(tmp_path / str(concurrency)),
+                batch_size=3,
+                max_concurrency=concurrency,
+            )
+            index = EmbeddingIndex(config, provider=MockEmbeddingProvider())
+            index.precompute(names)
+            assert index.api_calls == 4
+            results.append([index._get_normalized(n) for n in names])
+
+        np.testing.assert_allclose(results[0], results[1])
+
     def test_precompute_uses_cache(self, tmp_path: Path):
         # Pre-populate cache
         cache_file = tmp_path / "embedding_cache.json"
@@ -202,6 +393,18 @@ class TestEmbeddingIndexPrecompute:
 class TestEmbeddingIndexCosineSimilarity:
     """Tests for cosine similarity computation."""
 
+    def test_similarities_match_cosine_similarity(self, tmp_path: Path):
+        config = EmbeddingConfig(enabled=True, cache_dir=str(tmp_path))
+        index = EmbeddingIndex(config, provider=MockEmbeddingProvider())
+        b_names = ["Apple Inc", "Microsoft Corp", "Google LLC"]
+        index.build(b_names)
+        index.precompute(["Apple"])
+
+        sims = index.similarities("Apple", [2, 0])
+
+        expected = [index.cosine_similarity("Apple", b_names[i]) for i in (2, 0)]
+        np.testing.assert_allclose(sims, expected, rtol=1e-5, atol=1e-6)
+
     def test_cosine_similarity_without_provider(self, tmp_path: Path):
         config = EmbeddingConfig(enabled=True, cache_dir=str(tmp_path))
         index = EmbeddingIndex(config, provider=None)
@@ -294,3 +497,7 @@ class TestEmbeddingConfig:
         assert config.ann_neighbors == 50
         assert config.cache_dir == "/custom/path"
         assert config.batch_size == 100
+
+    def test_unknown_quantization_rejected(self):
+        with pytest.raises(ValueError, match="binray"):
+            EmbeddingConfig(quantization="binray")
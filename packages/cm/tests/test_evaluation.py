@@ -12,6 +12,7 @@ from cm.evaluation import (
     load_labeled_pairs,
 )
 from cm.config import MatchConfig
+from cm.matcher import Matcher
 
 
 class TestLoadLabeledPairs:
@@ -145,6 +146,51 @@ class TestEvaluateBatch:
         assert len(results) == 1
         # Should be true negative or ambiguous if no match found
 
+    def test_batch_parallel_matches_serial(self, monkeypatch: pytest.MonkeyPatch):
+        a_names = ["Apple Inc", "Microsoft Corp", "Google LLC", "Unknown Corp"]
+        b_names = ["Apple Incorporated", "Microsoft Corporation", "Google Limited"]
+        labeled_matches = {0: 0, 1: 1, 2: 2}
+
+        _, serial = evaluate_batch(a_names, b_names, labeled_matches, workers=1)
+        monkeypatch.setattr("cm.matcher._MIN_PARALLEL_NAMES", 0)
+        _, parallel = evaluate_batch(a_names, b_names, labeled_matches, workers=2)
+
+        assert [(r.a_id, r.decision, r.b_id) for r in parallel] == [
+            (r.a_id, r.decision, r.b_id) for r in serial
+        ]
+
+    def test_batch_parallel_merges_worker_stats(self, monkeypatch: pytest.MonkeyPatch):
+        a_names = ["Apple Inc", "Microsoft Corp", "Unknown Corp"]
+        b_names = ["Apple Incorporated", "Microsoft Corporation"]
+        monkeypatch.setattr("cm.matcher._MIN_PARALLEL_NAMES", 0)
+        captured: list[Matcher] = []
+        real_parallel = Matcher._match_all_parallel
+
+        def spy(matcher, names, workers):
+            captured.append(matcher)
+            return real_parallel(matcher, names, workers)
+
+        monkeypatch.setattr(Matcher, "_match_all_parallel", spy)
+        evaluate_batch(a_names, b_names, {}, workers=2)
+
+        stats = captured[0].stats
+        assert stats.a_count == 3
+        assert sum(stats.decisions.values()) == 3
+
+    def test_batch_parallel_with_llm_matches_serial(self, monkeypatch: pytest.MonkeyPatch):
+        a_names = ["First National Bank", "Microsoft Corp", "Unknown Corp"]
+        b_names = ["First National Bank of Boston", "First National Bank of Chicago", "Microsoft Corporation"]
+        config = MatchConfig()
+        config.llm.enabled = True
+
+        serial_metrics, serial = evaluate_batch(a_names, b_names, {}, config, workers=1)
+        monkeypatch.setattr("cm.matcher._MIN_PARALLEL_NAMES", 0)
+        parallel_metrics, parallel = evaluate_batch(a_names, b_names, {}, config, workers=2)
+
+        assert [(r.decision, r.b_id) for r in parallel] == [(r.decision, r.b_id) for r in serial]
+        assert serial[0].decision == "REVIEW"
+        assert parallel_metrics.ambiguous_count == serial_metrics.ambiguous_count
+
     def test_batch_precision_recall(self):
         a_names = ["Apple Inc", "Microsoft Corp", "Google LLC"]
         b_names = ["Apple Incorporated", "Microsoft Corporation", "Google Limited"]
@@ -90,3 +90,15 @@ def test_embedding_candidates_merged():
     b_ids = {c.b_id for c in candidates}
     assert 1 in b_ids
     assert 2 in b_ids
+
+
+def test_lexical_cap_prefers_more_sources():
+    config = CandidateConfig(max_candidates_lexical=1)
+    index = BlockingIndex(config)
+    b_names = [normalize(n) for n in ["Acme Widgets Alpha", "Acme Widgets"]]
+    index.build(b_names)
+
+    a = normalize("Acme Widgets")
+    candidates = index.retrieve_candidates(a)
+    assert [c.b_id for c in candidates] == [1]
+    assert candidates[0].sources == {"k_core", "k_prefix2", "k_first"}
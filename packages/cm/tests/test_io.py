@@ -6,7 +6,7 @@ import tempfile
 
 import pytest
 
-from cm.io import read_names, write_results
+from cm.io import read_excel, read_names, write_excel, write_results
 from cm.types import MatchResult
 
 
@@ -204,3 +204,66 @@ class TestWriteResults:
         content = csv_file.read_text()
         lines = content.strip().split("\n")
         assert len(lines) == 4  # header + 3 results
+
+    def test_write_jsonl_without_orjson(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr("cm.io.orjson", None)
+        jsonl_file = tmp_path / "results.jsonl"
+        results = [
+            MatchResult(a_id=1, a_name="A", b_id=10, b_name="A Inc", decision="MATCH", score=0.9),
+            MatchResult(a_id=2, a_name="B", b_id=None, b_name=None, decision="NO_MATCH", score=0.0),
+        ]
+
+        write_results(results, jsonl_file)
+
+        records = [json.loads(line) for line in jsonl_file.read_text().splitlines()]
+        assert [r["a_id"] for r in records] == [1, 2]
+        assert records[1]["b_id"] is None
+
+
+class TestExcel:
+    """Tests for the Excel read/write helpers."""
+
+    def test_excel_round_trip(self, tmp_path: Path):
+        import pandas as pd
+
+        path = tmp_path / "names.xlsx"
+        df = pd.DataFrame({"CUP_NAME": ["Apple Inc", "Google LLC"], "CUP_ID": ["c1", "c2"]})
+
+        write_excel(df, path)
+
+        assert read_excel(path).to_dict("records") == df.to_dict("records")
+
+    def test_excel_round_trip_without_xlsxwriter(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        import pandas as pd
+
+        monkeypatch.setattr("cm.io.xlsxwriter", None)
+        path = tmp_path / "names.xlsx"
+        df = pd.DataFrame({"A_name": ["Apple Inc", "Bank"], "score": [0.9, None]})
+
+        write_excel(df, path)
+
+        result = read_excel(path)
+        assert result["A_name"].tolist() == ["Apple Inc", "Bank"]
+        assert result["score"].isna().tolist() == [False, True]
+
+    def test_excel_cache_reused_until_file_changes(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        import os
+
+        import pandas as pd
+
+        path = tmp_path / "names.xlsx"
+        cache_dir = tmp_path / "cache"
+        write_excel(pd.DataFrame({"A": ["Apple Inc"]}), path)
+        read_excel(path, cache_dir=cache_dir)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("workbook re-parsed despite cache")
+
+        monkeypatch.setattr(pd, "read_excel", fail)
+        assert read_excel(path, cache_dir=cache_dir)["A"].tolist() == ["Apple Inc"]
+
+        monkeypatch.undo()
+        write_excel(pd.DataFrame({"A": ["Google LLC"]}), path)
+        os.utime(path, ns=(0, 1))
+        assert read_excel(path, cache_dir=cache_dir)["A"].tolist() == ["Google LLC"]
+        assert len(list(cache_dir.glob("*.pkl"))) == 1
@@ -234,6 +234,44 @@ class TestLLMArbiterCaching:
 
         assert len(provider.calls) == 2
 
+    def test_cache_persists_across_arbiters(self, tmp_path):
+        config = LLMConfig(enabled=True, cache_path=str(tmp_path / "llm.jsonl"))
+        a = make_normalized_name("Apple Inc", ["apple", "inc"])
+        b = make_normalized_name("Apple Incorporated", ["apple", "incorporated"])
+        scored = make_scored_candidate()
+        LLMArbiter(config, provider=MockLLMProvider()).arbitrate(a, b, scored, runner_up_score=0.75)
+
+        provider = MockLLMProvider()
+        arbiter = LLMArbiter(config, provider=provider)
+        decision, response = arbiter.arbitrate(a, b, scored, runner_up_score=0.75)
+        arbiter.arbitrate(a, b, scored, runner_up_score=0.75, strip_categories=["location"])
+
+        assert decision == "MATCH"
+        assert response.reason == "test"
+        # Only the pair asked with different ignored categories is re-queried
+        assert len(provider.calls) == 1
+
+    def test_parse_failures_not_persisted(self, tmp_path):
+        config = LLMConfig(enabled=True, cache_path=str(tmp_path / "llm.jsonl"))
+        a = make_normalized_name("Apple Inc", ["apple", "inc"])
+        b = make_normalized_name("Apple Incorporated", ["apple", "incorporated"])
+        scored = make_scored_candidate()
+        garbled = MockLLMProvider("not valid json")
+        arbiter = LLMArbiter(config, provider=garbled)
+        arbiter.arbitrate(a, b, scored, runner_up_score=0.75)
+        arbiter.arbitrate(a, b, scored, runner_up_score=0.75)
+
+        provider = MockLLMProvider()
+        decision, response = LLMArbiter(config, provider=provider).arbitrate(
+            a, b, scored, runner_up_score=0.75
+        )
+
+        # Reused within the run, but a later run asks again
+        assert len(garbled.calls) == 1
+        assert len(provider.calls) == 1
+        assert decision == "MATCH"
+        assert response.reason == "test"
+
 
 class TestLLMArbiterCallCounting:
     """Tests for global call counting."""
@@ -253,6 +291,29 @@ class TestLLMArbiterCallCounting:
 
         assert arbiter.calls_made == 1
 
+    def test_concurrent_calls_respect_global_cap(self):
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        class SlowProvider(MockLLMProvider):
+            def query(self, prompt: str) -> str:
+                time.sleep(0.05)
+                return super().query(prompt)
+
+        provider = SlowProvider()
+        arbiter = LLMArbiter(LLMConfig(enabled=True, global_call_cap=2), provider=provider)
+        b = make_normalized_name("Apple Incorporated", ["apple", "incorporated"])
+        names = [make_normalized_name(f"Apple {i}", ["apple", f"x{i}"]) for i in range(5)]
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            list(pool.map(
+                lambda a: arbiter.arbitrate(a, b, make_scored_candidate(), runner_up_score=0.75),
+                names,
+            ))
+
+        assert len(provider.calls) == 2
+        assert arbiter.calls_made == 2
+
     def test_cache_hits_dont_count(self):
         config = LLMConfig(enabled=True)
         provider = MockLLMProvider()
@@ -284,6 +345,20 @@ class TestLLMArbiterErrorHandling:
         assert response.decision == "UNSURE"
         assert response.reason == "parse_error"
 
+    def test_fenced_json_response(self):
+        config = LLMConfig(enabled=True)
+        provider = MockLLMProvider(
+            '```json\n{"decision": "SAME", "confidence": 0.9, "reason": "fenced"}\n```'
+        )
+        arbiter = LLMArbiter(config, provider=provider)
+        a = make_normalized_name("Apple Inc", ["apple", "inc"])
+        b = make_normalized_name("Apple Incorporated", ["apple", "incorporated"])
+
+        decision, response = arbiter.arbitrate(a, b, make_scored_candidate(), runner_up_score=0.75)
+
+        assert decision == "MATCH"
+        assert response.reason == "fenced"
+
     def test_provider_exception(self):
         config = LLMConfig(enabled=True)
 
@@ -0,0 +1,61 @@
+"""Tests for manual match storage."""
+
+from pathlib import Path
+
+import pandas as pd
+
+from cm.manual_matches import ManualMatchStore
+
+
+def test_a_to_b_map_tracks_add_and_remove(tmp_path: Path):
+    store = ManualMatchStore(tmp_path / "manual_matches.json")
+    store.load()
+    store.add_match(["Acme", "ACME Co"], "Acme Corp", "1")
+    store.add_match(["Acme"], "Acme Holdings", "2")
+
+    mapping = store.get_a_to_b_map()
+    assert mapping == {"Acme": ("Acme Holdings", "2"), "ACME Co": ("Acme Corp", "1")}
+
+    # Removing the later match falls back to the earlier one for shared names
+    store.remove_match(1)
+    assert mapping == {"Acme": ("Acme Corp", "1"), "ACME Co": ("Acme Corp", "1")}
+
+    store.remove_match(0)
+    assert mapping == {}
+
+
+def test_a_to_b_map_survives_reload(tmp_path: Path):
+    path = tmp_path / "manual_matches.json"
+    store = ManualMatchStore(path)
+    store.add_match(["Globex"], "Globex Corporation", None)
+
+    reloaded = ManualMatchStore(path)
+    reloaded.load()
+    assert reloaded.get_a_to_b_map() == {"Globex": ("Globex Corporation", None)}
+
+
+def test_apply_to_results_overrides_matched_rows(tmp_path: Path):
+    store = ManualMatchStore(tmp_path / "manual_matches.json")
+    store.add_match(["Globex"], "Globex Inc", "G-2")
+    results = pd.DataFrame({
+        "A_name": ["Acme", "Globex"],
+        "matched_CUP_NAME": ["Acme Corp", None],
+        "matched_CUP_ID": [1.0, None],  # numeric IDs, as read back from Excel
+        "decision": ["MATCH", "REVIEW"],
+        "score": [0.95, 0.5],
+        "runner_up_score": [0.2, 0.4],
+        "reasons": ["core_overlap_high", "fuzzy_high"],
+    })
+
+    assert store.apply_to_results(results) == 1
+
+    assert results.loc[0].tolist() == [
+        "Acme", "Acme Corp", 1.0, "MATCH", 0.95, 0.2, "core_overlap_high",
+    ]
+    globex = results.loc[1]
+    assert globex["matched_CUP_NAME"] == "Globex Inc"
+    assert globex["matched_CUP_ID"] == "G-2"
+    assert globex["decision"] == "MANUAL_MATCH"
+    assert globex["score"] == 1.0
+    assert pd.isna(globex["runner_up_score"])
+    assert globex["reasons"] == "manual_match"
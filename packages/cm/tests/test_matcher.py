@@ -36,6 +36,19 @@ def test_match_all():
     assert results[1].decision == "MATCH"
 
 
+def test_match_all_scores_repeated_names_once():
+    matcher = Matcher()
+    matcher.preprocess_b(["Apple Inc", "Microsoft Corp", "Google LLC"])
+    results = matcher.match_all(["Apple Inc.", "Zzzzz", "Apple Inc.", "Zzzzz"])
+    assert [r.a_id for r in results] == [0, 1, 2, 3]
+    assert results[2].decision == results[0].decision == "MATCH"
+    assert results[2].score == results[0].score
+    assert results[2] is not results[0]
+    assert matcher.stats.decisions["MATCH"] == 2
+    assert matcher.stats.no_candidates == 2
+    assert matcher.stats.comparisons == results[0].debug["candidate_count"]
+
+
 def test_no_candidates_returns_no_match():
     matcher = Matcher()
     matcher.preprocess_b(["Alpha Corp", "Beta Ltd"])
@@ -52,6 +65,20 @@ def test_match_result_has_debug():
     assert "candidate_count" in result.debug
 
 
+def test_clean_match_debug_omits_candidates_unless_debug_always():
+    matcher = Matcher()
+    matcher.preprocess_b(["Apple Inc", "Microsoft Corp", "Google LLC"])
+    result = matcher.match_one("Apple Inc.")
+    assert result.decision == "MATCH"
+    assert result.debug == {"candidate_count": result.debug["candidate_count"]}
+
+    config = MatchConfig(debug_always=True)
+    matcher = Matcher(config)
+    matcher.preprocess_b(["Apple Inc", "Microsoft Corp", "Google LLC"])
+    result = matcher.match_one("Apple Inc.")
+    assert result.debug["top_candidates"][0]["b_id"] == 0
+
+
 def test_margin_rule():
     """Two very similar candidates should trigger ambiguity."""
     config = MatchConfig()
@@ -87,3 +114,127 @@ def test_close_name_variants():
     result = matcher.match_one("Johnson and Johnson")
     assert result.decision == "MATCH"
     assert result.b_name == "Johnson & Johnson"
+
+
+def test_reset_b_replaces_b_list():
+    matcher = Matcher()
+    matcher.preprocess_b(["Apple Inc", "Microsoft Corp"])
+    matcher.reset_b()
+    matcher.preprocess_b(["Google LLC"])
+    result = matcher.match_one("Apple Inc.")
+    assert result.decision == "NO_MATCH"
+    assert matcher.match_one("Google LLC").b_name == "Google LLC"
+
+
+def test_match_all_embeds_a_names_in_one_batch(tmp_path):
+    from cm.config import EmbeddingConfig
+
+    class CountingProvider:
+        def __init__(self):
+            self.calls: list[list[str]] = []
+
+        def embed_batch(self, texts: list[str]) -> list[list[float]]:
+            self.calls.append(texts)
+            return [[float(len(t)), 1.0, 0.5, 0.25] for t in texts]
+
+    provider = CountingProvider()
+    config = MatchConfig(embedding=EmbeddingConfig(enabled=True, cache_dir=str(tmp_path)))
+    matcher = Matcher(config, embedding_provider=provider)
+    matcher.preprocess_b(["Apple Inc", "Microsoft Corp"])
+    provider.calls.clear()
+
+    # Only misses are sent, deduplicated, in a single call
+    matcher.match_all(["Apple Inc.", "Amazon", "Oracle Corp", "Amazon", "Oracle"])
+    assert len(provider.calls) == 1
+    assert sorted(provider.calls[0]) == ["amazon", "oracle"]
+
+
+def test_match_all_parallel_arbitrates_in_parent(tmp_path, monkeypatch):
+    import threading
+
+    from cm.config import EmbeddingConfig
+
+    class LocalProvider:
+        """Neither provider can be pickled, like the Gemini clients."""
+
+        def __init__(self):
+            self._lock = threading.Lock()
+            self.calls: list[str] = []
+
+        def embed_batch(self, texts: list[str]) -> list[list[float]]:
+            return [[float(len(t)), 1.0, 0.5, 0.25] for t in texts]
+
+        def query(self, prompt: str) -> str:
+            self.calls.append(prompt)
+            return '{"decision": "SAME", "confidence": 0.9, "reason": "test"}'
+
+    monkeypatch.setattr("cm.matcher._MIN_PARALLEL_NAMES", 0)
+    provider = LocalProvider()
+    config = MatchConfig(embedding=EmbeddingConfig(enabled=True, cache_dir=str(tmp_path)))
+    config.llm.enabled = True
+    matcher = Matcher(config, llm_provider=provider, embedding_provider=provider)
+    matcher.preprocess_b(["First National Bank of Boston", "First National Bank of Chicago"])
+
+    results = matcher.match_all(["First National Bank", "Unknown Corp"], workers=2)
+
+    assert results[0].used_llm and results[0].decision == "MATCH"
+    assert len(provider.calls) == 1
+    assert matcher.stats.llm_calls == 1
+    assert sum(matcher.stats.decisions.values()) == 2
+
+
+def test_repeated_review_name_arbitrated_once(tmp_path):
+    import time
+
+    from cm.config import EmbeddingConfig
+
+    class SlowProvider:
+        def __init__(self):
+            self.calls: list[str] = []
+
+        def embed_batch(self, texts: list[str]) -> list[list[float]]:
+            return [[float(len(t)), 1.0, 0.5, 0.25] for t in texts]
+
+        def query(self, prompt: str) -> str:
+            self.calls.append(prompt)
+            time.sleep(0.05)
+            return '{"decision": "SAME", "confidence": 0.9, "reason": "test"}'
+
+    provider = SlowProvider()
+    config = MatchConfig(embedding=EmbeddingConfig(enabled=True, cache_dir=str(tmp_path)))
+    config.llm.enabled = True
+    matcher = Matcher(config, llm_provider=provider, embedding_provider=provider)
+    matcher.preprocess_b(["First National Bank of Boston", "First National Bank of Chicago"])
+
+    results = matcher.match_all(["First National Bank"] * 3)
+
+    assert len(provider.calls) == 1
+    assert [r.a_id for r in results] == [0, 1, 2]
+    assert all(r.used_llm and r.b_name == results[0].b_name for r in results)
+    assert matcher.stats.llm_overrides == 3
+    assert matcher.stats.decisions["MATCH"] == 3
+
+
+def test_parallel_workers_inherit_log_level(monkeypatch, capfd):
+    import structlog
+
+    import cm.logging
+
+    monkeypatch.setattr(cm.logging, "_debug_enabled", cm.logging._debug_enabled)
+    monkeypatch.setattr(cm.logging, "_level", cm.logging._level)
+    saved = structlog.get_config()
+    try:
+        # As the CLI does in main(); workers must not fall back to printing debug
+        cm.logging.configure_logging("INFO")
+        matcher = Matcher()
+        matcher.preprocess_b(["Apple Inc", "Microsoft Corp", "Google LLC"])
+        capfd.readouterr()
+
+        results = matcher._match_all_parallel(
+            ["Apple Inc.", "Microsoft Corporation", "Amazon", "Google"], workers=2
+        )
+    finally:
+        structlog.configure(**saved)
+
+    assert [r.a_id for r in results] == [0, 1, 2, 3]
+    assert capfd.readouterr().out == ""
@@ -1,7 +1,7 @@
 """Tests for the normalization pipeline."""
 
 from cm.config import MatchConfig
-from cm.normalize import normalize
+from cm.normalize import normalize, normalize_many
 
 
 def test_basic_normalization():
@@ -23,6 +23,12 @@ def test_casefold():
     assert "microsoft" in result.core_tokens
 
 
+def test_casefold_non_ascii():
+    result = normalize("STRASSE GROSSE Müller GmbH")
+    assert result.core_tokens == ["strasse", "grosse", "müller"]
+    assert normalize("Straße Holdings").core_tokens[0] == "strasse"
+
+
 def test_ampersand_replacement():
     result = normalize("Johnson & Johnson")
     assert "johnson" in result.core_tokens
@@ -44,6 +50,11 @@ def test_punctuation_removal():
     assert "gamble" in result.core_tokens
 
 
+def test_punctuation_removal_ascii_and_non_ascii_tokens():
+    result = normalize("O'Brien-Smith (Zürich·Süd) Holdings")
+    assert result.raw_tokens == ["obriensmith", "zürichsüd", "holdings"]
+
+
 def test_designator_stripping():
     result = normalize("General Electric Corp.")
     assert "corp" not in result.core_tokens
@@ -132,3 +143,11 @@ def test_config_no_plus_to_and():
     result = normalize("A + B", config)
     # "+" should become space (punctuation removal) but not "and"
     assert "and" not in result.core_tokens
+
+
+def test_normalize_many_matches_normalize():
+    names = ["Apple Inc.", "General Electric Corp.", "Apple Inc.", "I.B.M."]
+    results = normalize_many(names)
+    assert [r.core_string for r in results] == [normalize(n).core_string for n in names]
+    # Repeated inputs are normalized once and share the result
+    assert results[0] is results[2]